@@ -23,6 +23,7 @@ import os
 import sys
 import sqlite3
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, List, Any
@@ -433,6 +434,26 @@ def load_conversations(cursor: sqlite3.Cursor, bubble_map: Dict[str, Dict],
     return conversations
 
 
+def _load_db_conversations(db_path: Path) -> List[Dict]:
+    """Load conversations from one Cursor database, or [] if unreadable."""
+    try:
+        # Open database in read-only mode to prevent any modifications
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        cursor = conn.cursor()
+
+        try:
+            bubble_map = load_bubble_map(cursor)
+            context_map = load_context_map(cursor)
+            return load_conversations(cursor, bubble_map, context_map)
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        # Suppress "no such table" warnings - expected for some workspace DBs
+        if "no such table" not in str(e):
+            print(f"Warning: Could not read {db_path}: {e}", file=sys.stderr)
+        return []
+
+
 def load_all_data(session_id: Optional[str] = None,
                   role_filter: Optional[str] = None,
                   project_filter: Optional[str] = None) -> List[Dict]:
@@ -445,29 +466,15 @@ def load_all_data(session_id: Optional[str] = None,
     all_conversations = []
     seen_ids = set()  # Avoid duplicates across databases
 
-    for db_path in db_paths:
-        try:
-            # Open database in read-only mode to prevent any modifications
-            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
-            cursor = conn.cursor()
-
-            try:
-                bubble_map = load_bubble_map(cursor)
-                context_map = load_context_map(cursor)
-                conversations = load_conversations(cursor, bubble_map, context_map)
-
-                # Add unique conversations
-                for conv in conversations:
-                    if conv["id"] not in seen_ids:
-                        seen_ids.add(conv["id"])
-                        all_conversations.append(conv)
-            finally:
-                conn.close()
-        except sqlite3.Error as e:
-            # Suppress "no such table" warnings - expected for some workspace DBs
-            if "no such table" not in str(e):
-                print(f"Warning: Could not read {db_path}: {e}", file=sys.stderr)
-            continue
+    # Each database gets its own read-only connection on a worker thread;
+    # map() keeps results in db_paths order so deduplication is unchanged
+    with ThreadPoolExecutor(max_workers=min(8, len(db_paths))) as pool:
+        for conversations in pool.map(_load_db_conversations, db_paths):
+            # Add unique conversations
+            for conv in conversations:
+                if conv["id"] not in seen_ids:
+                    seen_ids.add(conv["id"])
+                    all_conversations.append(conv)
 
     conversations = all_conversations
 
@@ -9,8 +9,10 @@ This replaces the removed ``up memory sync`` and ``up sync`` commands
 that hooks previously (incorrectly) referenced.
 """
 
+import contextlib
 import logging
 import os
+import re
 import sys
 import warnings
 from pathlib import Path
@@ -18,6 +20,8 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+_UPDATED_RE = re.compile(r"\*\*Updated\*\*:\s*[\d-]+")
+
 
 def sync_memory(workspace: Path) -> dict[str, Any]:
     """Sync memory: index recent commits and file changes.
@@ -28,16 +32,15 @@ def sync_memory(workspace: Path) -> dict[str, Any]:
     warnings.filterwarnings("ignore")
     logging.getLogger("chromadb").setLevel(logging.ERROR)
 
-    old_stderr = sys.stderr
     try:
-        sys.stderr = open(os.devnull, "w")
-        from up.memory import MemoryManager
-
-        # Always use JSON backend in hooks — loading ChromaDB/sentence-transformers
-        # triggers BLAS (gemm_thread_n) which segfaults on macOS due to thread
-        # stack size limits. Hooks only index commit messages; keyword search suffices.
-        manager = MemoryManager(workspace, use_vectors=False)
-        results = manager.sync()
+        with _silenced_stderr():
+            from up.memory import MemoryManager
+
+            # Always use JSON backend in hooks — loading ChromaDB/sentence-transformers
+            # triggers BLAS (gemm_thread_n) which segfaults on macOS due to thread
+            # stack size limits. Hooks only index commit messages; keyword search suffices.
+            manager = MemoryManager(workspace, use_vectors=False)
+            results = manager.sync()
         return {
             "commits": results.get("commits_indexed", 0),
             "files": results.get("files_indexed", 0),
@@ -46,9 +49,31 @@ def sync_memory(workspace: Path) -> dict[str, Any]:
     except Exception as exc:
         logger.debug("Memory sync failed: %s", exc)
         return {"error": str(exc)}
+
+
+@contextlib.contextmanager
+def _silenced_stderr():
+    """Point file descriptor 2 at /dev/null for the duration of the block.
+
+    Redirecting the descriptor rather than swapping ``sys.stderr`` also
+    silences native extensions that write to stderr directly.
+    """
+    try:
+        saved = os.dup(2)
+    except OSError:
+        # No stderr to silence
+        yield
+        return
+    sys.stderr.flush()
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    try:
+        os.dup2(devnull, 2)
+        yield
     finally:
-        sys.stderr.close()
-        sys.stderr = old_stderr
+        sys.stderr.flush()
+        os.dup2(saved, 2)
+        os.close(devnull)
+        os.close(saved)
 
 
 def sync_context(workspace: Path) -> dict[str, Any]:
@@ -56,7 +81,6 @@ def sync_context(workspace: Path) -> dict[str, Any]:
 
     Called by the post-checkout hook.
     """
-    import re
     from datetime import date
 
     updated = 0
@@ -64,11 +88,7 @@ def sync_context(workspace: Path) -> dict[str, Any]:
     if context_file.exists():
         content = context_file.read_text()
         today = date.today().isoformat()
-        new_content = re.sub(
-            r"\*\*Updated\*\*:\s*[\d-]+",
-            f"**Updated**: {today}",
-            content,
-        )
+        new_content = _UPDATED_RE.sub(f"**Updated**: {today}", content)
         if new_content != content:
             context_file.write_text(new_content)
             updated += 1
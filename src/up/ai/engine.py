@@ -5,6 +5,7 @@ Allows decoupling from specific AI CLI implementations.
 """
 
 import abc
+import os
 import shutil
 import subprocess
 import threading
@@ -21,6 +22,23 @@ from up.exceptions import (
 
 console = Console()
 
+# Resolved executable paths keyed by (name, PATH) so a multi-task loop
+# walks PATH once per CLI instead of on every is_available() call.
+_which_cache: dict[tuple[str, str], str | None] = {}
+
+
+def _which(name: str) -> str | None:
+    """Memoized ``shutil.which`` lookup, invalidated when PATH changes."""
+    key = (name, os.environ.get("PATH", ""))
+    if key not in _which_cache:
+        _which_cache[key] = shutil.which(name)
+    return _which_cache[key]
+
+
+def clear_which_cache() -> None:
+    """Forget memoized executable lookups (e.g. after installing a CLI)."""
+    _which_cache.clear()
+
 
 class AIEngine(abc.ABC):
     """Abstract base class for an AI execution engine."""
@@ -80,16 +98,16 @@ class CliEngine(AIEngine):
             self._cli_name, _ = self._detect_cli()
 
     def _detect_cli(self) -> tuple[str, bool]:
-        if shutil.which("claude"):
+        if _which("claude"):
             return "claude", True
-        if shutil.which("agent"):
+        if _which("agent"):
             return "agent", True
         return "", False
 
     def is_available(self) -> bool:
         if not self._cli_name:
             return False
-        return bool(shutil.which(self._cli_name))
+        return bool(_which(self._cli_name))
 
     def name(self) -> str:
         return self._cli_name or ""
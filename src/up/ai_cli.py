@@ -5,6 +5,8 @@ This module wraps the AIEngine abstraction, supporting both:
 - AgentSdkEngine: in-process via claude-agent-sdk (persistent sessions, hooks, compaction)
 """
 
+import logging
+import os
 from collections.abc import Callable
 from pathlib import Path
 
@@ -16,9 +18,15 @@ from up.exceptions import (  # noqa: F401
     AICliTimeoutError,
 )
 
+logger = logging.getLogger(__name__)
+
+# CLI names CliEngine knows how to drive (UP_AI_CLI must be one of these)
+SUPPORTED_CLIS = frozenset({"claude", "agent"})
+
 # Shared engine instances
 _default_engine: AIEngine | None = None
 _sdk_engine: AIEngine | None = None
+_cli_engines: dict[str, AIEngine] = {}
 
 
 def _get_engine(
@@ -40,7 +48,9 @@ def _get_engine(
         return _sdk_engine
 
     if cli_name:
-        return CliEngine(cli_name=cli_name)
+        if cli_name not in _cli_engines:
+            _cli_engines[cli_name] = CliEngine(cli_name=cli_name)
+        return _cli_engines[cli_name]
     if _default_engine is None:
         _default_engine = CliEngine()
     return _default_engine
@@ -49,12 +59,22 @@ def _get_engine(
 def check_ai_cli() -> tuple[str, bool]:
     """Check which AI CLI is available.
     
-    Checks for Claude CLI first, then Cursor agent CLI.
+    Honors ``UP_AI_CLI`` (e.g. ``UP_AI_CLI=agent``) to pin the CLI and skip
+    detection; otherwise checks for Claude CLI first, then Cursor agent CLI.
+    An unsupported value is ignored with a warning. PATH lookups are
+    memoized per process.
     
     Returns:
         (cli_name, available) - e.g., ("claude", True) or ("agent", True)
     """
-    engine = CliEngine()
+    pinned = os.environ.get("UP_AI_CLI", "").strip()
+    if pinned and pinned not in SUPPORTED_CLIS:
+        logger.warning(
+            "Ignoring UP_AI_CLI=%r: expected one of %s",
+            pinned, ", ".join(sorted(SUPPORTED_CLIS)),
+        )
+        pinned = ""
+    engine = CliEngine(cli_name=pinned) if pinned else CliEngine()
     return engine.name(), engine.is_available()
 
 
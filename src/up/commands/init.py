@@ -1,5 +1,7 @@
 """up init - Initialize up systems in existing project."""
 
+import os
+import re
 import stat
 from pathlib import Path
 
@@ -11,6 +13,9 @@ from up.templates import scaffold_project
 
 console = Console()
 
+# Sentinels around the block up-cli owns inside a git hook script
+_HOOK_BLOCK_RE = re.compile(rb"(?ms)^# >>> up-cli hook start\n.*?^# <<< up-cli hook end\n?")
+
 
 @click.command()
 @click.option(
@@ -239,25 +244,36 @@ def _build_initial_memory(workspace: Path) -> dict:
 def check_hooks_installed(workspace: Path) -> dict:
     """Check if up-cli hooks are installed.
     
-    Returns dict with status of each hook.
+    Returns dict with status of each hook. One directory listing decides
+    which hooks exist; only those are opened.
     """
     git_dir = workspace / ".git"
-    if not git_dir.exists():
-        return {"git": False, "post_commit": False, "post_checkout": False}
-
     hooks_dir = git_dir / "hooks"
+    try:
+        with os.scandir(hooks_dir) as entries:
+            present = {entry.name for entry in entries}
+    except OSError:
+        return {"git": git_dir.exists(), "post_commit": False, "post_checkout": False}
 
-    result = {"git": True, "post_commit": False, "post_checkout": False}
+    return {
+        "git": True,
+        "post_commit": "post-commit" in present and _is_up_hook(hooks_dir / "post-commit"),
+        "post_checkout": "post-checkout" in present and _is_up_hook(hooks_dir / "post-checkout"),
+    }
 
-    post_commit = hooks_dir / "post-commit"
-    if post_commit.exists() and "up-cli" in post_commit.read_text():
-        result["post_commit"] = True
 
-    post_checkout = hooks_dir / "post-checkout"
-    if post_checkout.exists() and "up-cli" in post_checkout.read_text():
-        result["post_checkout"] = True
+def _is_up_hook(path: Path) -> bool:
+    """Whether a hook script carries the up-cli marker.
 
-    return result
+    One open, no separate exists() stat, and a byte search with no decode.
+    The whole file is read because _write_hook appends our block after any
+    existing user hook, so the marker need not be near the top.
+    """
+    try:
+        with open(path, "rb") as f:
+            return b"up-cli" in f.read()
+    except OSError:
+        return False
 
 
 def _install_git_hooks(workspace: Path) -> bool:
@@ -277,6 +293,7 @@ def _install_git_hooks(workspace: Path) -> bool:
     # Post-commit hook
     post_commit = hooks_dir / "post-commit"
     post_commit_content = '''#!/bin/bash
+# >>> up-cli hook start
 # up-cli auto-sync hook (installed by up init)
 # Indexes commits to memory automatically via internal runtime
 
@@ -287,6 +304,7 @@ elif command -v python &> /dev/null; then
 fi
 
 exit 0
+# <<< up-cli hook end
 '''
 
     _write_hook(post_commit, post_commit_content)
@@ -294,6 +312,7 @@ exit 0
     # Post-checkout hook (for branch switches)
     post_checkout = hooks_dir / "post-checkout"
     post_checkout_content = '''#!/bin/bash
+# >>> up-cli hook start
 # up-cli context update hook (installed by up init)
 # Updates context when switching branches via internal runtime
 
@@ -311,6 +330,7 @@ if [ "$BRANCH_CHECKOUT" = "1" ]; then
 fi
 
 exit 0
+# <<< up-cli hook end
 '''
 
     _write_hook(post_checkout, post_checkout_content)
@@ -319,19 +339,37 @@ exit 0
 
 
 def _write_hook(path: Path, content: str):
-    """Write hook file with executable permissions."""
-    # Check for existing hook
-    if path.exists():
-        existing = path.read_text()
-        if "up-cli" in existing:
-            # Already our hook, overwrite
-            pass
-        else:
-            # User has custom hook, append
-            content = existing + "\n\n" + content
-
-    path.write_text(content)
-    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    """Write hook file with executable permissions.
+
+    A hook that already contains this exact content is left untouched.
+    When the hook holds an older sentinel-delimited up-cli block, only that
+    block is replaced. The mode is only changed when the executable bit is
+    missing.
+    """
+    data = content.encode()
+    try:
+        existing = path.read_bytes()
+    except FileNotFoundError:
+        existing = b""
+
+    block = _HOOK_BLOCK_RE.search(data)
+    if data in existing:
+        # Current version of our hook, nothing to write
+        pass
+    elif block and _HOOK_BLOCK_RE.search(existing):
+        # Swap in our new block, keeping whatever the user has around it
+        path.write_bytes(_HOOK_BLOCK_RE.sub(lambda _: block.group(0), existing, count=1))
+    elif existing and b"up-cli" not in existing:
+        # User has custom hook, append
+        with open(path, "ab") as f:
+            f.write(b"\n\n" + data)
+    else:
+        # New hook, or an older version of ours: overwrite
+        path.write_bytes(data)
+
+    mode = path.stat().st_mode
+    if not mode & stat.S_IEXEC:
+        path.chmod(mode | stat.S_IEXEC)
 
 
 def _print_next_steps(systems: tuple, hooks_installed: bool):
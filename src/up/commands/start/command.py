@@ -7,9 +7,7 @@ from pathlib import Path
 
 import click
 from rich.console import Console
-from rich.panel import Panel
 
-from up.ai_cli import check_ai_cli, get_ai_cli_install_instructions
 from up.commands.start.helpers import (
     check_circuit_breaker,
     display_status_table,
@@ -18,11 +16,6 @@ from up.commands.start.helpers import (
     load_loop_state,
     reset_circuit_breaker,
 )
-from up.commands.start.loop import (
-    preview_loop,
-    run_ai_product_loop,
-    run_manual_loop,
-)
 from up.ui import THEME
 
 console = Console(theme=THEME)
@@ -78,6 +71,8 @@ def start_cmd(
 
     cb_status = check_circuit_breaker(state, workspace=cwd)
 
+    from rich.panel import Panel
+
     console.print()
     console.print(Panel.fit(
         "[bold blue]Product Loop[/] - SESRC Autonomous Development",
@@ -122,12 +117,22 @@ def start_cmd(
         )
         return
 
+    # Loop and AI engine modules are only imported once a mode is chosen,
+    # keeping them off the import path of `up --help` and other commands
+    from up.commands.start.loop import (
+        preview_loop,
+        run_ai_product_loop,
+        run_manual_loop,
+    )
+
     # Dry run mode
     if dry_run:
         console.print("\n[yellow]DRY RUN MODE[/] - No changes will be made")
         preview_loop(cwd, state, task_source, task)
         return
 
+    from up.ai_cli import check_ai_cli, get_ai_cli_install_instructions
+
     # Check AI availability
     use_ai = not no_ai
 
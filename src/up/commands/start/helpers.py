@@ -3,48 +3,111 @@
 State loading, task finding, checkpoint operations, and PRD management.
 """
 
-import json
 import logging
+import os
 import re
 import time
 from pathlib import Path
 
 from rich.console import Console
-from rich.table import Table
 
 from up.core.checkpoint import NotAGitRepoError, get_checkpoint_manager
-from up.core.state import CircuitBreakerState, get_state_manager
+from up.core.prd_schema import TaskSourceKind, task_source_kind
+from up.core.state import get_state_manager
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Unchecked markdown checkbox; matched on raw bytes so TODO files need no decoding
+_UNCHECKED_MARKER = b"- [ ]"
+_UNCHECKED_RE = re.compile(re.escape(_UNCHECKED_MARKER))
+# TODO files larger than this are counted in fixed-size chunks
+_COUNT_CHUNK_THRESHOLD = 1024 * 1024
+_COUNT_CHUNK_SIZE = 64 * 1024
+
+# README prefix included in implementation prompts, cached per file version
+README_EXCERPT_CHARS = 2000
+_readme_cache: dict[tuple[str, int, int], str] = {}
+
+# Unchecked-item counts for markdown task files, cached per file version
+_todo_count_cache: dict[tuple[str, int, int], int] = {}
+
+# Top-level entries that mark a workspace as set up by ``up init``
+_INIT_MARKERS = frozenset({".claude", ".cursor", ".up", "CLAUDE.md"})
+# is_initialized results keyed by (workspace, directory mtime_ns)
+_init_cache: dict[tuple[str, int], bool] = {}
+# Directory mtimes newer than this may still change within the same
+# timestamp tick, so results for them are not cached (cf. git's racy index)
+_INIT_CACHE_MIN_AGE_NS = 2_000_000_000
+
+
+def _scan_dir(path: str | Path) -> dict[str, bool]:
+    """Map entry names in ``path`` to whether they are regular files.
+
+    ``DirEntry.is_file()`` uses the type returned by the directory read,
+    so no per-entry stat is needed on most filesystems.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry.is_file() for entry in entries}
+    except OSError:
+        return {}
+
 
 def is_initialized(workspace: Path) -> bool:
-    """Check if project is initialized with up systems."""
-    return (
-        (workspace / ".claude").exists()
-        or (workspace / ".cursor").exists()
-        or (workspace / ".up").exists()
-        or (workspace / "CLAUDE.md").exists()
-    )
+    """Check if project is initialized with up systems.
+
+    Uses a single directory listing rather than one stat per marker, and
+    skips even that while the workspace directory's mtime is unchanged.
+    """
+    ws = os.fspath(workspace)
+    try:
+        mtime_ns = os.stat(ws).st_mtime_ns
+    except OSError:
+        return False
+
+    key = (ws, mtime_ns)
+    cached = _init_cache.get(key)
+    if cached is not None:
+        return cached
+
+    result = not _scan_dir(ws).keys().isdisjoint(_INIT_MARKERS)
+    if time.time_ns() - mtime_ns > _INIT_CACHE_MIN_AGE_NS:
+        _init_cache.clear()
+        _init_cache[key] = result
+    return result
+
+
+_TASK_SOURCES = (
+    "prd.json",
+    ".claude/skills/learning-system/prd.json",
+    ".cursor/skills/learning-system/prd.json",
+    "TODO.md",
+    "docs/todo/TODO.md",
+)
 
 
 def find_task_source(workspace: Path, prd_path: str = None) -> str:
-    """Find task source file."""
+    """Find task source file.
+
+    Candidates are matched against directory listings: the workspace is
+    listed once, and a nested directory only when its top-level parent
+    exists.
+    """
     if prd_path:
         return prd_path
 
-    # Check common locations
-    sources = [
-        "prd.json",
-        ".claude/skills/learning-system/prd.json",
-        ".cursor/skills/learning-system/prd.json",
-        "TODO.md",
-        "docs/todo/TODO.md",
-    ]
-
-    for source in sources:
-        if (workspace / source).exists():
+    ws = os.fspath(workspace)
+    top = _scan_dir(ws)
+    for source in _TASK_SOURCES:
+        parent, _, name = source.rpartition("/")
+        if not parent:
+            if top.get(name):
+                return source
+            continue
+        if source.partition("/")[0] not in top:
+            continue
+        if _scan_dir(os.path.join(ws, parent)).get(name):
             return source
 
     return None
@@ -84,52 +147,83 @@ def save_loop_state(workspace: Path, state: dict) -> None:
     """Save loop state to unified state file.
 
     Accepts dict for backwards compatibility, converts to StateManager.
+    Fields are written onto the live state in place, so circuit breakers
+    keep their thresholds and timestamps, and an unchanged state is not
+    rewritten. Only a COMMIT-phase save is fsync'ed; earlier phases ride
+    the page cache.
     """
     manager = get_state_manager(workspace)
+    loop = manager.state.loop
 
     # Update loop state from dict
-    manager.state.loop.iteration = state.get("iteration", 0)
-    manager.state.loop.phase = state.get("phase", "IDLE")
-    manager.state.loop.current_task = state.get("current_task")
-    manager.state.loop.last_checkpoint = state.get("last_checkpoint")
+    loop.iteration = state.get("iteration", 0)
+    loop.phase = state.get("phase", "IDLE")
+    loop.current_task = state.get("current_task")
+    loop.last_checkpoint = state.get("last_checkpoint")
 
-    if "tasks_completed" in state:
-        manager.state.loop.tasks_completed = state["tasks_completed"]
+    if "tasks_completed" in state and state["tasks_completed"] is not loop.tasks_completed:
+        loop.tasks_completed = list(state["tasks_completed"])
 
     # Update circuit breakers
-    if "circuit_breaker" in state:
-        for name, cb_data in state["circuit_breaker"].items():
-            if isinstance(cb_data, dict):
-                manager.state.circuit_breakers[name] = CircuitBreakerState(
-                    failures=cb_data.get("failures", 0),
-                    state=cb_data.get("state", "CLOSED"),
-                )
+    for name, cb_data in state.get("circuit_breaker", {}).items():
+        if isinstance(cb_data, dict):
+            cb = manager.get_circuit_breaker(name)
+            cb.failures = cb_data.get("failures", 0)
+            cb.state = cb_data.get("state", "CLOSED")
 
-    manager.save()
+    manager.save(durable=state.get("phase") == "COMMIT")
 
 
 def count_tasks(workspace: Path, task_source: str) -> int:
-    """Count remaining tasks in source file."""
+    """Count remaining tasks in source file.
+
+    Parsed results are reused until the file's mtime or size changes.
+    """
     filepath = workspace / task_source
 
-    if not filepath.exists():
+    try:
+        st = filepath.stat()
+    except OSError:
         return 0
 
-    if task_source.endswith(".json"):
+    kind = task_source_kind(task_source)
+    if kind is TaskSourceKind.PRD:
+        from up.core.prd_schema import PRDValidationError, load_prd_summary
+
         try:
-            data = json.loads(filepath.read_text())
-            stories = data.get("userStories", [])
-            return len([s for s in stories if not s.get("passes", False)])
-        except json.JSONDecodeError:
+            return load_prd_summary(filepath).remaining
+        except PRDValidationError:
             return 0
 
-    elif task_source.endswith(".md"):
-        content = filepath.read_text()
-        return len(re.findall(r"- \[ \]", content))
+    elif kind is TaskSourceKind.TODO:
+        key = (str(filepath), st.st_mtime_ns, st.st_size)
+        count = _todo_count_cache.get(key)
+        if count is None:
+            count = _count_unchecked(filepath)
+            _todo_count_cache.clear()
+            _todo_count_cache[key] = count
+        return count
 
     return 0
 
 
+def _count_unchecked(filepath: Path) -> int:
+    """Count ``- [ ]`` markers without materializing a match list."""
+    if filepath.stat().st_size <= _COUNT_CHUNK_THRESHOLD:
+        return sum(1 for _ in _UNCHECKED_RE.finditer(filepath.read_bytes()))
+
+    # Keep a tail shorter than the marker so split matches are seen exactly once
+    tail_len = len(_UNCHECKED_MARKER) - 1
+    count = 0
+    tail = b""
+    with filepath.open("rb") as f:
+        while chunk := f.read(_COUNT_CHUNK_SIZE):
+            window = tail + chunk
+            count += sum(1 for _ in _UNCHECKED_RE.finditer(window))
+            tail = window[-tail_len:]
+    return count
+
+
 def reset_circuit_breaker(workspace: Path) -> None:
     """Reset all circuit breakers to CLOSED state.
 
@@ -203,10 +297,10 @@ def get_next_task_from_prd(prd_path: Path, workspace: Path = None, auto_sync: bo
     """
     from dataclasses import asdict
 
-    from up.core.prd_schema import PRDValidationError, load_prd, save_prd
+    from up.core.prd_schema import PRDValidationError, load_prd, load_prd_summary, save_prd
 
     try:
-        prd = load_prd(prd_path)
+        summary = load_prd_summary(prd_path)
     except PRDValidationError:
         return None
 
@@ -221,20 +315,18 @@ def get_next_task_from_prd(prd_path: Path, workspace: Path = None, auto_sync: bo
             logger.debug("Failed to read completed tasks from state: %s", exc)
 
     # Find first truly incomplete task
-    synced = False
-    for story in prd.userStories:
-        if story.passes:
-            continue
-        if story.id in completed_in_state:
-            if auto_sync:
-                story.passes = True
-                story.completedAt = story.completedAt or time.strftime("%Y-%m-%d")
-                synced = True
-            continue
-        return asdict(story)
+    for story in summary.pending:
+        if story.id not in completed_in_state:
+            return asdict(story)
 
-    if auto_sync and synced:
+    synced_ids = {s.id for s in summary.pending if s.id in completed_in_state}
+    if auto_sync and synced_ids:
         try:
+            prd = load_prd(prd_path)
+            for story in prd.userStories:
+                if not story.passes and story.id in synced_ids:
+                    story.passes = True
+                    story.completedAt = story.completedAt or time.strftime("%Y-%m-%d")
             save_prd(prd, prd_path)
         except Exception as exc:
             logger.warning("Failed to persist PRD auto-sync updates: %s", exc)
@@ -243,31 +335,43 @@ def get_next_task_from_prd(prd_path: Path, workspace: Path = None, auto_sync: bo
 
 
 def display_status_table(state: dict, task_source: str, workspace: Path, resume: bool):
-    """Display status table."""
-    table = Table(show_header=False, box=None, padding=(0, 2))
-    table.add_column("Key", style="dim")
-    table.add_column("Value")
+    """Display status table.
 
+    When stdout is not a terminal (pipes, CI, parallel workers) the rows
+    are written as plain ``Key: value`` lines without building a Rich table.
+    """
     iteration = state.get("iteration", 0)
-    table.add_row("Iteration", f"[cyan]{iteration}[/]")
-
     phase = state.get("phase", "INIT")
-    table.add_row("Phase", f"[cyan]{phase}[/]")
+    completed = len(state.get("tasks_completed", []))
+    success_rate = state.get("metrics", {}).get("success_rate", 1.0)
 
+    # (label, plain value, markup value)
+    rows = [
+        ("Iteration", f"{iteration}", f"[cyan]{iteration}[/]"),
+        ("Phase", f"{phase}", f"[cyan]{phase}[/]"),
+    ]
     if task_source:
         task_count = count_tasks(workspace, task_source)
-        table.add_row("Tasks", f"[cyan]{task_count}[/] remaining from {task_source}")
+        tasks = f"remaining from {task_source}"
+        rows.append(("Tasks", f"{task_count} {tasks}", f"[cyan]{task_count}[/] {tasks}"))
     else:
-        table.add_row("Tasks", "[dim]No task source[/]")
+        rows.append(("Tasks", "No task source", "[dim]No task source[/]"))
+    rows.append(("Completed", f"{completed}", f"[green]{completed}[/]"))
+    rows.append(("Success Rate", f"{success_rate*100:.0f}%", f"[green]{success_rate*100:.0f}%[/]"))
+    mode = "Resume" if resume else "Fresh Start"
+    rows.append(("Mode", mode, mode))
 
-    completed = len(state.get("tasks_completed", []))
-    table.add_row("Completed", f"[green]{completed}[/]")
+    if not console.is_terminal:
+        console.out("\n".join(f"{label}: {plain}" for label, plain, _ in rows), highlight=False)
+        return
 
-    success_rate = state.get("metrics", {}).get("success_rate", 1.0)
-    table.add_row("Success Rate", f"[green]{success_rate*100:.0f}%[/]")
+    from rich.table import Table
 
-    mode = "Resume" if resume else "Fresh Start"
-    table.add_row("Mode", mode)
+    table = Table(show_header=False, box=None, padding=(0, 2))
+    table.add_column("Key", style="dim")
+    table.add_column("Value")
+    for label, _, markup in rows:
+        table.add_row(label, markup)
 
     console.print(table)
 
@@ -295,8 +399,12 @@ def rollback_checkpoint(workspace: Path, checkpoint_id: str = None) -> bool:
 
 
 def mark_task_complete(workspace: Path, task_source: str, task_id: str) -> None:
-    """Mark a task as complete in the PRD."""
-    if not task_source or not task_source.endswith(".json"):
+    """Mark a task as complete in the PRD.
+
+    The PRD is only rewritten when the story actually changed, so re-runs
+    and ``--resume`` over already-completed tasks leave the file untouched.
+    """
+    if task_source_kind(task_source) is not TaskSourceKind.PRD:
         return
 
     prd_path = workspace / task_source
@@ -333,12 +441,23 @@ def _format_prd_extras(task: dict) -> str:
     return ("\n\n" + "\n\n".join(parts)) if parts else ""
 
 
-def build_research_prompt(workspace: Path, task: dict, task_source: str) -> str:
-    """Build a prompt for the AI to research the task."""
+def format_task_header(task: dict) -> str:
+    """Format the task block shared by every phase prompt."""
     task_id = task.get("id", "unknown")
     task_title = task.get("title", "")
     task_desc = task.get("description", task_title)
-    extras = _format_prd_extras(task)
+    return (
+        f"Task ID: {task_id}\nTitle: {task_title}\n"
+        f"Description: {task_desc}{_format_prd_extras(task)}"
+    )
+
+
+def build_research_prompt(
+    workspace: Path, task: dict, task_source: str, header: str | None = None,
+) -> str:
+    """Build a prompt for the AI to research the task."""
+    if header is None:
+        header = format_task_header(task)
 
     progress_md = workspace / ".up/thoughts/progress.md"
     progress_info = ""
@@ -347,9 +466,7 @@ def build_research_prompt(workspace: Path, task: dict, task_source: str) -> str:
 
     return f"""PHASE 1: RESEARCH
 
-Task ID: {task_id}
-Title: {task_title}
-Description: {task_desc}{extras}{progress_info}
+{header}{progress_info}
 
 Your objective is to thoroughly research the codebase to understand how to implement this task.
 Do NOT make any code changes yet.
@@ -363,18 +480,16 @@ Instructions:
 When you have saved your findings, end your turn."""
 
 
-def build_plan_prompt(workspace: Path, task: dict, task_source: str) -> str:
+def build_plan_prompt(
+    workspace: Path, task: dict, task_source: str, header: str | None = None,
+) -> str:
     """Build a prompt for the AI to plan the task implementation."""
-    task_id = task.get("id", "unknown")
-    task_title = task.get("title", "")
-    task_desc = task.get("description", task_title)
-    extras = _format_prd_extras(task)
+    if header is None:
+        header = format_task_header(task)
 
     return f"""PHASE 2: PLAN
 
-Task ID: {task_id}
-Title: {task_title}
-Description: {task_desc}{extras}
+{header}
 
 Your objective is to create a step-by-step implementation plan based on your previous research.
 Do NOT make any code changes yet.
@@ -388,18 +503,16 @@ Instructions:
 When you have saved the plan, end your turn so a human can review it."""
 
 
-def build_implement_prompt(workspace: Path, task: dict, task_source: str) -> str:
+def build_implement_prompt(
+    workspace: Path, task: dict, task_source: str, header: str | None = None,
+) -> str:
     """Build a prompt for the AI to implement the task based on the plan."""
-    task_id = task.get("id", "unknown")
-    task_title = task.get("title", "")
-    task_desc = task.get("description", task_title)
-    extras = _format_prd_extras(task)
+    if header is None:
+        header = format_task_header(task)
 
     return f"""PHASE 3: IMPLEMENT
 
-Task ID: {task_id}
-Title: {task_title}
-Description: {task_desc}{extras}
+{header}
 
 Your objective is to implement the task according to the agreed plan.
 
@@ -413,6 +526,37 @@ Instructions:
 7. End your turn when all changes are made and tests pass."""
 
 
+def _readme_excerpt(workspace: Path) -> str:
+    """Return the first README_EXCERPT_CHARS of the project README.
+
+    Only the excerpt is read from disk, and the result is cached by
+    ``(path, mtime_ns, size)`` since it is identical for every task in a run.
+    """
+    readme = workspace / "README.md"
+    try:
+        st = readme.stat()
+    except OSError:
+        readme = workspace / "Readme.md"
+        try:
+            st = readme.stat()
+        except OSError:
+            return ""
+
+    key = (str(readme), st.st_mtime_ns, st.st_size)
+    cached = _readme_cache.get(key)
+    if cached is not None:
+        return cached
+
+    with readme.open("r", encoding="utf-8", errors="replace") as f:
+        content = f.read(README_EXCERPT_CHARS + 1)
+    if len(content) > README_EXCERPT_CHARS:
+        content = content[:README_EXCERPT_CHARS] + "..."
+
+    _readme_cache.clear()
+    _readme_cache[key] = content
+    return content
+
+
 def build_implementation_prompt(workspace: Path, task: dict, task_source: str) -> str:
     """Build a prompt for the AI to implement the task."""
     task_id = task.get("id", "unknown")
@@ -422,14 +566,9 @@ def build_implementation_prompt(workspace: Path, task: dict, task_source: str) -
 
     # Read project context
     context = ""
-    readme = workspace / "README.md"
-    if not readme.exists():
-        readme = workspace / "Readme.md"
-    if readme.exists():
-        content = readme.read_text()
-        if len(content) > 2000:
-            content = content[:2000] + "..."
-        context = f"\n\nProject README:\n{content}"
+    excerpt = _readme_excerpt(workspace)
+    if excerpt:
+        context = f"\n\nProject README:\n{excerpt}"
 
     return f"""Implement this task in the current project:
 
@@ -3,24 +3,20 @@
 Contains the main AI product loop and manual/preview modes.
 """
 
-import json
 import logging
 import signal
 import sys
-import time
 from dataclasses import asdict
-from datetime import datetime
 from pathlib import Path
 
 from rich.console import Console
-from rich.panel import Panel
-from tqdm import tqdm
 
 from up.ai_cli import run_ai_task
 from up.commands.start.helpers import (
     build_implement_prompt,
     build_plan_prompt,
     build_research_prompt,
+    format_task_header,
     get_next_task_from_prd,
     save_loop_state,
 )
@@ -30,58 +26,15 @@ from up.commands.start.verification import (
     get_modified_files,
 )
 from up.core.loop import LoopOrchestrator
-from up.core.prd_schema import PRDValidationError, load_prd
+from up.core.prd_schema import PRDValidationError, TaskSourceKind, load_prd, task_source_kind
 from up.ui import ProductLoopDisplay, TaskStatus
 from up.ui.loop_display import LoopStatus
 
 console = Console()
 logger = logging.getLogger(__name__)
 
-
-def _get_memory_hint(workspace: Path, task: dict) -> str | None:
-    """Check for memory hints from auto-recall for the current task.
-
-    Returns a formatted hint string to prepend to the AI prompt, or None.
-    """
-    try:
-        from up.memory import MemoryManager
-        from up.memory.patterns import ErrorPatternExtractor
-
-        # Check if there's a recent error for this task in state
-        state_file = workspace / ".up" / "state.json"
-        if not state_file.exists():
-            return None
-
-        state_data = json.loads(state_file.read_text())
-        last_error = state_data.get("loop", {}).get("last_error", "")
-        if not last_error:
-            return None
-
-        extractor = ErrorPatternExtractor()
-        keywords = extractor.extract(last_error)
-        if not keywords:
-            return None
-
-        query = " ".join(keywords)
-        manager = MemoryManager(workspace, use_vectors=False)
-        results = manager.search(query, limit=3, entry_type="error")
-
-        if not results:
-            return None
-
-        best = results[0]
-        content = best.content if hasattr(best, "content") else str(best)
-        ts = best.timestamp if hasattr(best, "timestamp") else "unknown"
-
-        logger.info("Memory recall: applied hint from %s", ts)
-        return (
-            f"Past solution found:\n"
-            f"Previously, a similar error was solved by: {content}\n"
-            f"Consider this approach."
-        )
-    except Exception as exc:
-        logger.debug("Memory hint lookup failed: %s", exc)
-        return None
+# Successful tasks are recorded without fsync; make them durable this often
+STATE_SYNC_EVERY = 5
 
 
 def _restore_terminal():
@@ -94,35 +47,38 @@ def _restore_terminal():
         pass
 
 
-# Global state for interrupt handling
-_orchestrator: LoopOrchestrator | None = None
-_current_workspace = None
-_current_display: ProductLoopDisplay | None = None
+# Set by handle_interrupt; run_ai_product_loop checks it at safe points
+_interrupt_requested = False
+# Display of the running loop, so handle_interrupt can flag it as stopping
+_active_display: ProductLoopDisplay | None = None
 
 
 def handle_interrupt(signum, frame):
-    """Handle Ctrl+C interrupt - save state and checkpoint info."""
-    global _current_display
-
-    # Stop the display first if active
-    if _current_display:
-        _current_display.set_status(LoopStatus.PAUSED)
-        _current_display.log_warning("Interrupted by user")
-        time.sleep(0.3)
-        _current_display.stop()
-        _current_display = None
-
-    _restore_terminal()
-    console.print("\n\n[yellow]Interrupted! Saving state...[/]")
-
-    if _orchestrator and _current_workspace:
-        _orchestrator.mark_interrupted()
-        console.print("[green]✓[/] State saved to .up/state.json")
-        last_cp = _orchestrator.state_manager.state.loop.last_checkpoint
-        console.print(f"[dim]Checkpoint: {last_cp or 'none'}[/]")
-        console.print("\nTo resume: [cyan]up start --resume[/]")
-        console.print("To rollback: [cyan]up reset[/]")
-
+    """Handle Ctrl+C by asking the loop to stop at its next safe point.
+
+    Only flags are set here: display teardown, console output and state
+    writes are not safe inside a signal handler, so they happen in
+    run_ai_product_loop once it reaches a check. The live display's status
+    is a plain attribute its refresh thread picks up, so the user sees the
+    loop is stopping while the current step finishes. A second Ctrl+C
+    aborts immediately.
+    """
+    global _interrupt_requested
+    if _interrupt_requested:
+        raise KeyboardInterrupt
+    _interrupt_requested = True
+    if _active_display is not None:
+        _active_display.set_status(LoopStatus.STOPPING)
+
+
+def _report_interrupt(orch: LoopOrchestrator) -> None:
+    """Tell the user where an interrupted loop left off, then exit."""
+    console.print("\n\n[yellow]Interrupted![/]")
+    console.print("[green]✓[/] State saved to .up/state.json")
+    last_cp = orch.state_manager.state.loop.last_checkpoint
+    console.print(f"[dim]Checkpoint: {last_cp or 'none'}[/]")
+    console.print("\nTo resume: [cyan]up start --resume[/]")
+    console.print("To rollback: [cyan]up reset[/]")
     sys.exit(130)
 
 
@@ -138,17 +94,13 @@ def preview_loop(workspace: Path, state: dict, task_source: str, specific_task:
         ("COMMIT", "Update state and commit"),
     ]
 
-    console.print()
-    for phase, desc in tqdm(phases, desc="Phases", bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt}"):
-        time.sleep(0.3)
-
     console.print()
     for phase, desc in phases:
         console.print(f"  [cyan]{phase}[/]: {desc}")
 
     if specific_task:
         console.print(f"\n  Target task: [cyan]{specific_task}[/]")
-    elif task_source and task_source.endswith(".json"):
+    elif task_source_kind(task_source) is TaskSourceKind.PRD:
         next_task = get_next_task_from_prd(workspace / task_source)
         if next_task:
             console.print(f"\n  Next task: [cyan]{next_task.get('id')}[/] - {next_task.get('title')}")
@@ -162,6 +114,10 @@ def run_manual_loop(
     resume: bool = False,
 ):
     """Run the product loop with progress indicators (manual mode)."""
+    from datetime import datetime
+
+    from rich.panel import Panel
+
     if not resume:
         state["iteration"] = state.get("iteration", 0) + 1
         state["phase"] = "OBSERVE"
@@ -170,7 +126,7 @@ def run_manual_loop(
     next_task = None
     if specific_task:
         next_task = {"id": specific_task, "title": specific_task}
-    elif task_source and task_source.endswith(".json"):
+    elif task_source_kind(task_source) is TaskSourceKind.PRD:
         next_task = get_next_task_from_prd(workspace / task_source)
 
     if next_task:
@@ -186,25 +142,19 @@ def run_manual_loop(
 
     console.print("\n[bold]Loop Progress:[/]")
 
-    with tqdm(
-        total=len(phases),
-        desc="Initializing loop",
-        bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
-    ) as pbar:
-        for i, (phase, desc) in enumerate(phases):
-            state["phase"] = phase
-            pbar.set_description(f"{phase}: {desc}")
-            pbar.update(1)
-            if i >= 2:
-                break
-            time.sleep(0.5)
+    # The manual loop stops at EXECUTE; the remaining phases are the user's
+    for phase, desc in phases[:3]:
+        state["phase"] = phase
+        console.print(f"  [green]✓[/] [cyan]{phase}[/]: {desc}")
 
     save_loop_state(workspace, state)
 
     console.print("\n" + "─" * 50)
     console.print("\n[bold green]✓[/] Loop initialized at [cyan]EXECUTE[/] phase")
 
-    instructions = _generate_loop_instructions(workspace, state, task_source, specific_task)
+    instructions = _generate_loop_instructions(
+        workspace, state, task_source, specific_task, next_task=next_task,
+    )
     console.print(Panel(instructions, title="[bold]AI Instructions[/]", border_style="green"))
 
     console.print("\n[bold]Next Steps:[/]")
@@ -214,41 +164,49 @@ def run_manual_loop(
     console.print("  4. Run [cyan]up dashboard[/] for live monitoring")
 
 
+# Static tail of the manual-mode instructions panel
+_LOOP_COMMANDS = """SESRC Loop Commands:
+  ├─ Checkpoint: up save (creates git checkpoint)
+  ├─ Verify: pytest && mypy src/ && ruff check src/
+  ├─ Rollback: up reset (restores last checkpoint)
+  └─ Complete: up status (view progress)
+
+Circuit Breaker: 3 consecutive failures → OPEN
+State File: .up/state.json
+"""
+
+
 def _generate_loop_instructions(
-    workspace: Path, state: dict, task_source: str, specific_task: str = None
+    workspace: Path,
+    state: dict,
+    task_source: str,
+    specific_task: str = None,
+    next_task: dict | None = None,
 ) -> str:
-    """Generate instructions for the AI to execute the loop."""
+    """Generate instructions for the AI to execute the loop.
+
+    ``next_task`` is the task already resolved by the caller; when omitted
+    it is looked up from a JSON task source.
+    """
     task_info = ""
     if specific_task:
         task_info = f"Task: {specific_task}"
     elif task_source:
-        next_task = None
-        if task_source.endswith(".json"):
+        if next_task is None and task_source_kind(task_source) is TaskSourceKind.PRD:
             next_task = get_next_task_from_prd(workspace / task_source)
 
         if next_task:
-            task_info = f"Task: {next_task.get('id')} - {next_task.get('title')}"
-            if next_task.get("acceptanceCriteria"):
-                criteria = next_task.get("acceptanceCriteria", [])[:3]
-                task_info += "\n\nAcceptance Criteria:"
-                for c in criteria:
-                    task_info += f"\n  • {c}"
+            lines = [f"Task: {next_task.get('id')} - {next_task.get('title')}"]
+            criteria = next_task.get("acceptanceCriteria") or []
+            if criteria:
+                lines.append("\nAcceptance Criteria:")
+                lines.extend(f"  • {c}" for c in criteria[:3])
+            task_info = "\n".join(lines)
         else:
             task_info = f"Source: {task_source}"
 
-    return f"""Iteration #{state.get('iteration', 1)} - Phase: EXECUTE
-
-{task_info}
-
-SESRC Loop Commands:
-  ├─ Checkpoint: up save (creates git checkpoint)
-  ├─ Verify: pytest && mypy src/ && ruff check src/
-  ├─ Rollback: up reset (restores last checkpoint)
-  └─ Complete: up status (view progress)
-
-Circuit Breaker: 3 consecutive failures → OPEN
-State File: .up/state.json
-"""
+    iteration = state.get("iteration", 1)
+    return f"Iteration #{iteration} - Phase: EXECUTE\n\n{task_info}\n\n{_LOOP_COMMANDS}"
 
 
 def run_ai_product_loop(
@@ -269,11 +227,10 @@ def run_ai_product_loop(
     By default runs autonomously (no prompts). When ``interactive=True``,
     pauses for human review after the plan phase and on verification failure.
     """
-    global _orchestrator, _current_workspace, _current_display
+    global _interrupt_requested, _active_display
 
-    _current_workspace = workspace
     orch = LoopOrchestrator(workspace)
-    _orchestrator = orch
+    _interrupt_requested = False
     signal.signal(signal.SIGINT, handle_interrupt)
 
     # Use orchestrator for task selection
@@ -289,7 +246,7 @@ def run_ai_product_loop(
 
     # Build all_tasks for display (need full PRD list)
     all_tasks = []
-    if task_source and task_source.endswith(".json"):
+    if task_source_kind(task_source) is TaskSourceKind.PRD:
         prd_path = workspace / task_source
         try:
             prd = load_prd(prd_path)
@@ -301,17 +258,25 @@ def run_ai_product_loop(
 
     # Initialize display
     display = ProductLoopDisplay(console)
-    _current_display = display
     display.set_tasks(all_tasks)
     display.start()
+    _active_display = display
     display.log(f"Starting product loop with {len(tasks_to_run)} tasks")
     display.log(f"AI CLI: {cli_name} (timeout: {timeout}s)")
 
     completed = 0
     failed = 0
 
+    # Per-run invariants, formatted once rather than per phase
+    ai_running = f"  AI running: {cli_name} (timeout {timeout}s)"
+
+    def _on_ai_output(line: str):
+        display.log(f"  {line[:120]}")
+
     try:
         for task in tasks_to_run:
+            if _interrupt_requested:
+                break
             task_id = task.id
             task_title = task.title
 
@@ -338,21 +303,21 @@ def run_ai_product_loop(
                 "acceptanceCriteria": task.acceptance_criteria,
                 "files": task.files, "depends_on": task.depends_on,
             }
+            header = format_task_header(task_dict)
 
             # Phase 1: Research
             display.set_phase("RESEARCH")
             display.log(f"Phase 1/3: Researching {task_id}...")
-            display.log(f"  AI running: {cli_name} (timeout {timeout}s)")
-            prompt = build_research_prompt(workspace, task_dict, task_source)
+            display.log(ai_running)
+            prompt = build_research_prompt(workspace, task_dict, task_source, header)
 
             # Run Phase 1
-            def _on_ai_output(line: str):
-                display.log(f"  {line[:120]}")
-
             success, output = run_ai_task(
                 workspace, prompt, cli_name, timeout=timeout,
                 on_output=_on_ai_output, use_sdk=use_sdk,
             )
+            if _interrupt_requested:
+                break
             if success:
                 display.log_success("Research complete")
             else:
@@ -362,13 +327,15 @@ def run_ai_product_loop(
             if success:
                 display.set_phase("PLAN")
                 display.log("Phase 2/3: Planning implementation...")
-                display.log(f"  AI running: {cli_name} (timeout {timeout}s)")
-                prompt = build_plan_prompt(workspace, task_dict, task_source)
+                display.log(ai_running)
+                prompt = build_plan_prompt(workspace, task_dict, task_source, header)
                 success, output = run_ai_task(
                     workspace, prompt, cli_name, timeout=timeout,
                     continue_session=True, on_output=_on_ai_output,
                     use_sdk=use_sdk,
                 )
+                if _interrupt_requested:
+                    break
                 if success:
                     display.log_success("Plan complete")
                 else:
@@ -392,8 +359,8 @@ def run_ai_product_loop(
             if success:
                 display.set_phase("IMPLEMENT")
                 display.log("Phase 3/3: Implementing code changes...")
-                display.log(f"  AI running: {cli_name} (timeout {timeout}s)")
-                prompt = build_implement_prompt(workspace, task_dict, task_source)
+                display.log(ai_running)
+                prompt = build_implement_prompt(workspace, task_dict, task_source, header)
 
                 # Memory hint injection via orchestrator
                 memory_hint = orch.get_memory_hint(task)
@@ -411,9 +378,17 @@ def run_ai_product_loop(
                 else:
                     display.log_error("Implementation failed")
 
+            # The AI CLI shares our process group, so Ctrl+C also ends it;
+            # stop here rather than recording that as a task failure
+            if _interrupt_requested:
+                break
+
             if success:
                 display.log_success(f"Task {task_id} implemented")
 
+                # Collected before verification so tool caches don't show up
+                modified_files = get_modified_files(workspace)
+
                 # Verify
                 verification_passed = True
                 tests_passed = None
@@ -424,7 +399,9 @@ def run_ai_product_loop(
                     display.set_phase("VERIFY")
                     display.set_status(LoopStatus.VERIFYING)
                     display.log("Running verification (tests + lint + types)...")
-                    vresult = orch.run_verification()
+                    vresult = orch.run_verification(changed_files=modified_files)
+                    if _interrupt_requested:
+                        break
                     tests_passed = vresult.tests_passed
                     lint_passed = vresult.lint_passed
                     type_check_passed = vresult.type_check_passed
@@ -459,7 +436,6 @@ def run_ai_product_loop(
                 completed += 1
 
                 # Record success via orchestrator (state + PRD + provenance)
-                modified_files = get_modified_files(workspace)
                 success_result = orch.record_success(
                     task, task_source=task_source,
                     tests_passed=tests_passed,
@@ -469,6 +445,8 @@ def run_ai_product_loop(
                 )
                 display.update_task_status(task_id, TaskStatus.COMPLETE)
                 display.set_status(LoopStatus.RUNNING)
+                if completed % STATE_SYNC_EVERY == 0:
+                    orch.sync_state()
 
                 # Intentional Compaction (V1-020)
                 from up.context import ContextManager
@@ -535,10 +513,16 @@ def run_ai_product_loop(
                     break
 
     finally:
-        display.set_status(LoopStatus.COMPLETE if failed == 0 else LoopStatus.FAILED)
-        time.sleep(0.5)
+        _active_display = None
+        if _interrupt_requested:
+            display.set_status(LoopStatus.PAUSED)
+            display.log_warning("Interrupted by user")
+            orch.mark_interrupted()
+        else:
+            orch.sync_state()
+            display.set_status(LoopStatus.COMPLETE if failed == 0 else LoopStatus.FAILED)
+        # Live.stop() renders the final frame and leaves it on screen
         display.stop()
-        _current_display = None
         _restore_terminal()
 
         # Emit session end event to trigger handoff generation
@@ -547,6 +531,10 @@ def run_ai_product_loop(
         emit_session_end(summary=summary, source="loop")
 
     signal.signal(signal.SIGINT, signal.SIG_DFL)
+    if _interrupt_requested:
+        _report_interrupt(orch)
+
+    from rich.panel import Panel
 
     # Summary
     console.print(f"\n{'─' * 50}")
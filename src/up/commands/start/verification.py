@@ -4,8 +4,13 @@ Runs tests, linting, type checking, and collects file change information.
 Timeouts and required-check policy are driven by UpConfig.
 """
 
+import functools
+import importlib.util
+import os
+import shutil
 import subprocess
 import sys
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -21,6 +26,8 @@ class VerificationResult:
     tests_passed: bool | None = None
     lint_passed: bool | None = None
     type_check_passed: bool | None = None
+    # True when no check ran because the change could not affect them
+    skipped: bool = False
 
     def all_required_passed(self, required_checks: list[str]) -> bool:
         """Return True if every required check passed (or was not applicable).
@@ -40,6 +47,8 @@ class VerificationResult:
         return True
 
     def summary_parts(self) -> list[str]:
+        if self.skipped:
+            return ["checks skipped (docs-only change)"]
         labels = [
             ("tests", self.tests_passed),
             ("lint", self.lint_passed),
@@ -96,103 +105,175 @@ def run_verification_with_results(workspace: Path):
     return result.tests_passed, result.lint_passed
 
 
-def run_full_verification(workspace: Path) -> VerificationResult:
-    """Run tests, lint, and type checking.
+@functools.cache
+def _tool_available(module: str) -> bool:
+    """Whether ``python -m <module>`` can run; the toolchain is fixed for a run."""
+    return importlib.util.find_spec(module) is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _git() -> str:
+    """Absolute path to git, resolved once so each call skips the PATH search."""
+    return shutil.which("git") or "git"
 
-    This function is intentionally side-effect-free (no console output)
-    so it can run safely while a Rich Live display is active.
-    """
-    timeouts = _load_timeouts(workspace)
-    result = VerificationResult()
 
-    # --- Tests (pytest) ---
+def _spawn(cmd: list[str], workspace: Path) -> subprocess.Popen | None:
+    """Start a check in the background; None if the tool can't be launched."""
     try:
-        pytest_result = subprocess.run(
-            [sys.executable, "-m", "pytest", "-x", "-q", "--tb=short"],
+        return subprocess.Popen(
+            cmd,
             cwd=workspace,
-            capture_output=True,
-            text=True,
-            timeout=timeouts["test"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
-        if pytest_result.returncode == 0:
-            result.tests_passed = True
-        elif pytest_result.returncode == 5:
-            result.tests_passed = None  # no tests collected
-        else:
-            result.tests_passed = False
     except FileNotFoundError:
-        result.tests_passed = None
-    except subprocess.TimeoutExpired:
-        result.tests_passed = False
+        return None
+
 
-    # --- Lint (ruff) ---
+def _wait(proc: subprocess.Popen | None, deadline: float) -> int | None:
+    """Wait for a check until ``deadline``; None if missing or timed out."""
+    if proc is None:
+        return None
     try:
-        ruff_result = subprocess.run(
-            [sys.executable, "-m", "ruff", "check", "."],
-            cwd=workspace,
-            capture_output=True,
-            text=True,
-            timeout=timeouts["lint"],
-        )
-        result.lint_passed = ruff_result.returncode == 0
-    except FileNotFoundError:
-        result.lint_passed = None
+        return proc.wait(timeout=max(0.0, deadline - time.monotonic()))
     except subprocess.TimeoutExpired:
-        result.lint_passed = None
+        proc.kill()
+        proc.wait()
+        return None
 
-    # --- Type check (mypy) ---
-    try:
-        mypy_result = subprocess.run(
-            [sys.executable, "-m", "mypy", "src/", "--ignore-missing-imports", "--no-error-summary"],
-            cwd=workspace,
-            capture_output=True,
-            text=True,
-            timeout=timeouts["type_check"],
+
+# Changes limited to these files cannot affect tests, lint or types.
+# .txt is deliberately absent: requirements and test fixtures use it.
+_DOC_SUFFIXES = frozenset({".md", ".rst"})
+
+
+def _is_doc_path(path: str) -> bool:
+    return Path(path).suffix.lower() in _DOC_SUFFIXES
+
+
+def run_full_verification(
+    workspace: Path, changed_files: list[str] | None = None,
+) -> VerificationResult:
+    """Run tests, lint, and type checking.
+
+    The three tools are independent read-only passes over the workspace,
+    so they run concurrently; wall time is that of the slowest check.
+    pytest stops at the first failure and runs last-failed tests first.
+
+    When ``changed_files`` is non-empty, a change touching only Markdown or
+    reStructuredText files skips all checks (``skipped`` is set and every
+    result stays ``None``); otherwise ruff lints only the changed Python
+    files instead of the whole tree.
+
+    This function is intentionally side-effect-free (no console output)
+    so it can run safely while a Rich Live display is active.
+    """
+    result = VerificationResult()
+    ruff_targets = ["."]
+    if changed_files:
+        if all(_is_doc_path(f) for f in changed_files):
+            result.skipped = True
+            return result
+        ruff_targets = [
+            f for f in changed_files
+            if f.endswith(".py") and (workspace / f).exists()
+        ]
+
+    timeouts = _load_timeouts(workspace)
+
+    # A tool that isn't installed is skipped (result None) rather than
+    # launched only to fail with "No module named ..."
+    started = time.monotonic()
+    pytest_proc = ruff_proc = mypy_proc = None
+    if _tool_available("pytest"):
+        pytest_proc = _spawn(
+            [sys.executable, "-m", "pytest", "-x", "--ff", "-q", "--tb=short"], workspace,
+        )
+    if ruff_targets and _tool_available("ruff"):
+        ruff_proc = _spawn([sys.executable, "-m", "ruff", "check", *ruff_targets], workspace)
+    if _tool_available("mypy"):
+        mypy_proc = _spawn(
+            [
+                sys.executable, "-m", "mypy", "src/",
+                "--ignore-missing-imports", "--no-error-summary",
+            ],
+            workspace,
         )
-        result.type_check_passed = mypy_result.returncode == 0
-    except FileNotFoundError:
-        result.type_check_passed = None
-    except subprocess.TimeoutExpired:
-        result.type_check_passed = None
+
+    try:
+        # --- Lint (ruff) --- usually finishes first
+        code = _wait(ruff_proc, started + timeouts["lint"])
+        result.lint_passed = None if code is None else code == 0
+
+        # --- Type check (mypy) ---
+        code = _wait(mypy_proc, started + timeouts["type_check"])
+        result.type_check_passed = None if code is None else code == 0
+
+        # --- Tests (pytest) ---
+        code = _wait(pytest_proc, started + timeouts["test"])
+    finally:
+        # On KeyboardInterrupt (or any other error) don't leave the other
+        # checks running unattended
+        for proc in (ruff_proc, mypy_proc, pytest_proc):
+            if proc is not None and proc.poll() is None:
+                proc.kill()
+                proc.wait()
+
+    if pytest_proc is None:
+        result.tests_passed = None
+    elif code is None:
+        result.tests_passed = False  # timed out
+    elif code == 0:
+        result.tests_passed = True
+    elif code == 5:
+        result.tests_passed = None  # no tests collected
+    else:
+        result.tests_passed = False
 
     return result
 
 
 def get_modified_files(workspace: Path) -> list[str]:
-    """Get list of all changed files (modified + untracked)."""
-    files: list[str] = []
-    try:
-        result = subprocess.run(
-            ["git", "diff", "--name-only", "HEAD"],
-            cwd=workspace,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            files.extend(result.stdout.strip().split("\n"))
+    """Get list of all changed files (modified + untracked).
 
+    One ``git status`` call covers staged, unstaged and untracked paths;
+    ``-z`` keeps unusual file names unquoted. Output is parsed as bytes
+    and paths decoded with ``os.fsdecode``, so a non-UTF-8 name cannot
+    fail the whole listing.
+    """
+    try:
         result = subprocess.run(
-            ["git", "ls-files", "--others", "--exclude-standard"],
+            [_git(), "status", "--porcelain=v1", "-z", "--untracked-files=all"],
             cwd=workspace,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             timeout=30,
         )
-        if result.returncode == 0 and result.stdout.strip():
-            files.extend(result.stdout.strip().split("\n"))
-
-        return files
     except Exception:
-        return files or []
+        return []
+    if result.returncode != 0:
+        return []
+
+    files: list[str] = []
+    fields = iter(result.stdout.split(b"\0"))
+    for entry in fields:
+        if len(entry) < 4:
+            continue
+        status, path = entry[:2], entry[3:]
+        files.append(os.fsdecode(path))
+        if b"R" in status or b"C" in status:
+            next(fields, None)  # skip the rename/copy source path
+    return files
 
 
 def get_diff_summary(workspace: Path) -> str:
     """Get a summary of current changes."""
     result = subprocess.run(
-        ["git", "diff", "--stat", "HEAD"],
+        [_git(), "diff", "--stat", "HEAD"],
         cwd=workspace,
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         text=True,
     )
 
@@ -202,12 +283,17 @@ def get_diff_summary(workspace: Path) -> str:
 
 
 def commit_changes(workspace: Path, message: str) -> bool:
-    """Commit all changes with given message."""
-    subprocess.run(["git", "add", "-A"], cwd=workspace, capture_output=True)
+    """Commit all changes with given message.
+
+    Only exit codes matter here, so git's output goes straight to
+    /dev/null instead of through Python pipe buffers.
+    """
+    subprocess.run(
+        [_git(), "add", "-A"], cwd=workspace,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
     result = subprocess.run(
-        ["git", "commit", "-m", message],
-        cwd=workspace,
-        capture_output=True,
-        text=True,
+        [_git(), "commit", "-m", message], cwd=workspace,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
     return result.returncode == 0
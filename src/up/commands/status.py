@@ -1,16 +1,31 @@
 """up status - Show system health and status."""
 
 import json
+import os
 from pathlib import Path
 
 import click
 from rich.console import Console
-from rich.panel import Panel
 
 from up.commands.start.helpers import is_initialized
 
+try:
+    import orjson
+except ImportError:  # optional: pip install up-cli[fast]
+    orjson = None  # type: ignore[assignment]
+
 console = Console()
 
+# Progress bar cells, sliced rather than rebuilt per render
+_BAR_LEN = 20
+_FULL_BAR = "█" * _BAR_LEN
+_EMPTY_BAR = "░" * _BAR_LEN
+
+# (icon, color) per status; anything else renders as healthy
+_BUDGET_STYLE = {"CRITICAL": ("🔴", "red"), "WARNING": ("🟡", "yellow")}
+_CIRCUIT_STYLE = {"OPEN": ("🔴", "red"), "HALF_OPEN": ("🟡", "yellow")}
+_OK_STYLE = ("🟢", "green")
+
 
 @click.command()
 @click.option(
@@ -42,10 +57,22 @@ def status_cmd(as_json: bool, verbose: bool):
         status["provenance"] = _collect_provenance_summary(cwd)
 
     if as_json:
-        console.print(json.dumps(status, indent=2))
+        # Plain stdout: Rich markup parsing and soft-wrapping would corrupt it
+        click.echo(_dumps_status(status))
         return
 
-    display_status(status, verbose=verbose)
+    # Buffer the whole report so it reaches the terminal in one write
+    with console:
+        display_status(status, verbose=verbose)
+
+
+def _dumps_status(status: dict) -> str:
+    """Serialize status for --json, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            status, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    return json.dumps(status, indent=2)
 
 
 def collect_status(workspace: Path) -> dict:
@@ -143,8 +170,8 @@ def collect_status(workspace: Path) -> dict:
     status["hooks"] = check_hooks_installed(workspace)
 
     # Memory status
-    memory_dir = workspace / ".up" / "memory"
-    if memory_dir.exists():
+    ws = os.fspath(workspace)
+    if os.path.exists(os.path.join(ws, ".up", "memory")):
         try:
             from up.memory import MemoryManager
             manager = MemoryManager(workspace, use_vectors=False)
@@ -158,15 +185,8 @@ def collect_status(workspace: Path) -> dict:
             status["memory"] = {"total": 0}
 
     # Skills
-    skills_dirs = [
-        workspace / ".claude/skills",
-        workspace / ".cursor/skills",
-    ]
-    for skills_dir in skills_dirs:
-        if skills_dir.exists():
-            for skill_dir in skills_dir.iterdir():
-                if skill_dir.is_dir() and (skill_dir / "SKILL.md").exists():
-                    status["skills"].append(skill_dir.name)
+    for tool_dir in (".claude", ".cursor"):
+        status["skills"].extend(_list_skills(os.path.join(ws, tool_dir, "skills")))
 
     # Plugins
     try:
@@ -214,6 +234,27 @@ def collect_status(workspace: Path) -> dict:
     return status
 
 
+def _list_skills(skills_dir: str | Path) -> list[str]:
+    """Names of skill directories containing a SKILL.md.
+
+    Directory type comes from the scandir entry; only SKILL.md is stat'ed.
+    """
+    skills = []
+    try:
+        with os.scandir(skills_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                try:
+                    os.stat(os.path.join(entry.path, "SKILL.md"))
+                except OSError:
+                    continue
+                skills.append(entry.name)
+    except OSError:
+        pass
+    return skills
+
+
 def _collect_provenance_summary(workspace: Path) -> dict:
     """Collect provenance statistics for --verbose output."""
     try:
@@ -262,6 +303,7 @@ def _collect_legacy_status(workspace: Path, status: dict) -> None:
 
 def display_status(status: dict, verbose: bool = False) -> None:
     """Display status in rich format."""
+    from rich.panel import Panel
 
     # Header
     workspace_name = Path(status["workspace"]).name
@@ -287,15 +329,7 @@ def display_status(status: dict, verbose: bool = False) -> None:
             budget_status = budget.get("status", "OK")
 
             # Color based on status
-            if budget_status == "CRITICAL":
-                color = "red"
-                icon = "🔴"
-            elif budget_status == "WARNING":
-                color = "yellow"
-                icon = "🟡"
-            else:
-                color = "green"
-                icon = "🟢"
+            icon, color = _BUDGET_STYLE.get(budget_status, _OK_STYLE)
 
             console.print(f"  {icon} Status: [{color}]{budget_status}[/]")
             console.print(f"  Usage: {usage:.1f}% ({remaining:,} tokens remaining)")
@@ -311,15 +345,7 @@ def display_status(status: dict, verbose: bool = False) -> None:
                 cb_state = state.get("state", "UNKNOWN")
                 failures = state.get("failures", 0)
 
-                if cb_state == "OPEN":
-                    icon = "🔴"
-                    color = "red"
-                elif cb_state == "HALF_OPEN":
-                    icon = "🟡"
-                    color = "yellow"
-                else:
-                    icon = "🟢"
-                    color = "green"
+                icon, color = _CIRCUIT_STYLE.get(cb_state, _OK_STYLE)
 
                 console.print(f"  {icon} {name}: [{color}]{cb_state}[/] (failures: {failures})")
     else:
@@ -346,9 +372,8 @@ def display_status(status: dict, verbose: bool = False) -> None:
 
             if total > 0:
                 progress = completed / total * 100
-                bar_len = 20
-                filled = int(bar_len * completed / total)
-                bar = "█" * filled + "░" * (bar_len - filled)
+                filled = int(_BAR_LEN * completed / total)
+                bar = _FULL_BAR[:filled] + _EMPTY_BAR[filled:]
                 console.print(f"  Progress: [{bar}] {progress:.0f}% ({completed}/{total})")
 
             success_rate = loop.get("success_rate", 1.0)
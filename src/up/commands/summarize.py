@@ -5,7 +5,6 @@ from pathlib import Path
 
 import click
 from rich.console import Console
-from rich.panel import Panel
 
 console = Console()
 
@@ -47,6 +46,8 @@ def summarize_cmd(format: str, output: str, project: str, source: str):
       up summarize -f json -o out.json # JSON to file
       up summarize -p myproject        # Filter by project
     """
+    from rich.panel import Panel
+
     console.print(Panel.fit(
         "[bold blue]Conversation Summarizer[/]",
         border_style="blue"
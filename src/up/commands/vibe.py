@@ -6,6 +6,7 @@ These commands provide the core safety rails for AI-assisted development:
 - up diff: Review AI changes before accepting
 """
 
+import re
 import subprocess
 import sys
 from pathlib import Path
@@ -26,12 +27,27 @@ from up.core.state import get_state_manager
 
 console = Console()
 
+# Start of each file section in a unified diff
+_DIFF_FILE_RE = re.compile(r"(?m)^(?=diff --git )")
+
 
 def _print_error(err: Exception) -> None:
     """Print an exception message safely with Rich markup escaping."""
     console.print(f"[red]Error:[/] {escape(str(err))}")
 
 
+def _print_diff(diff_output: str) -> None:
+    """Print a unified diff with syntax highlighting, file by file."""
+    sections = [s for s in _DIFF_FILE_RE.split(diff_output) if s]
+    last = len(sections) - 1
+    for i, section in enumerate(sections):
+        # A section's trailing newline would render as a blank line
+        # between files; only the final one keeps it
+        if i < last:
+            section = section[:-1]
+        console.print(Syntax(section, "diff", theme="monokai", line_numbers=False))
+
+
 # =============================================================================
 # up save - Create checkpoint
 # =============================================================================
@@ -219,16 +235,13 @@ def diff_cmd(checkpoint_id: str, stat: bool, accept: bool, reject: bool, message
     try:
         manager = get_checkpoint_manager(cwd)
 
-        # Get diff
-        diff_output = manager.diff_from_checkpoint(checkpoint_id)
         stats = manager.diff_stats(checkpoint_id)
 
-        if not diff_output and stats["files"] == 0:
-            console.print("[dim]No changes since checkpoint[/]")
-            return
-
-        # Stats mode
+        # Stats mode: numstat totals only, the full diff is never generated
         if stat:
+            if stats["files"] == 0:
+                console.print("[dim]No changes since checkpoint[/]")
+                return
             console.print(Panel.fit(
                 f"[bold]Changes since checkpoint[/]\n\n"
                 f"Files: {stats['files']}\n"
@@ -238,6 +251,11 @@ def diff_cmd(checkpoint_id: str, stat: bool, accept: bool, reject: bool, message
             ))
             return
 
+        diff_output = manager.diff_from_checkpoint(checkpoint_id)
+        if not diff_output and stats["files"] == 0:
+            console.print("[dim]No changes since checkpoint[/]")
+            return
+
         # Reject mode
         if reject:
             console.print("[yellow]Rejecting changes...[/]")
@@ -289,9 +307,9 @@ def diff_cmd(checkpoint_id: str, stat: bool, accept: bool, reject: bool, message
         ))
         console.print()
 
-        # Syntax-highlighted diff
-        syntax = Syntax(diff_output, "diff", theme="monokai", line_numbers=False)
-        console.print(syntax)
+        # Syntax-highlighted diff, one file at a time so output starts
+        # immediately and only one file's highlighting is held in memory
+        _print_diff(diff_output)
 
         # Interactive prompt
         console.print()
@@ -3,18 +3,37 @@
 Tracks estimated token usage and provides warnings when approaching limits.
 """
 
+import heapq
 import json
-from dataclasses import asdict, dataclass, field
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from up.core.state import StateManager
 
 # Token estimation constants (rough estimates)
 CHARS_PER_TOKEN = 4  # Average characters per token
 CODE_MULTIPLIER = 1.3  # Code typically uses more tokens
 DEFAULT_BUDGET = 100_000  # Default context budget in tokens
 
+CODE_EXTENSIONS = frozenset({
+    '.py', '.js', '.ts', '.tsx', '.jsx', '.go', '.rs', '.java',
+    '.c', '.cpp', '.h', '.hpp', '.rb', '.sh', '.bash', '.zsh'
+})
 
-@dataclass
+# Linux only; skips the access-time update a read would otherwise cause
+_O_NOATIME = getattr(os, "O_NOATIME", 0)
+
+# estimate_file_tokens results keyed by (path, mtime_ns, size)
+_file_token_cache: dict[tuple[str, int, int], int] = {}
+_FILE_TOKEN_CACHE_MAX = 256
+
+
+@dataclass(slots=True)
 class ContextEntry:
     """A single context entry (file read, message, etc.)."""
 
@@ -23,8 +42,20 @@ class ContextEntry:
     source: str  # File path or description
     estimated_tokens: int
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "ContextEntry":
+        return cls(
+            data["timestamp"], data["entry_type"], data["source"], data["estimated_tokens"],
+        )
+
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Flat fields: no need for asdict()'s recursive deep copy
+        return {
+            "timestamp": self.timestamp,
+            "entry_type": self.entry_type,
+            "source": self.source,
+            "estimated_tokens": self.estimated_tokens,
+        }
 
 
 @dataclass
@@ -73,21 +104,24 @@ class ContextBudget:
         }
 
 
-def estimate_tokens(text: str, is_code: bool = False) -> int:
+def estimate_tokens(text: str, is_code: bool = False, length: int | None = None) -> int:
     """Estimate token count for text.
     
     Args:
         text: The text to estimate
         is_code: Whether the text is code (uses higher multiplier)
+        length: Character count, if already known (``text`` is then ignored)
         
     Returns:
         Estimated token count
     """
-    if not text:
+    if length is None:
+        length = len(text) if text else 0
+    if not length:
         return 0
 
     # Basic character-based estimation
-    base_tokens = len(text) / CHARS_PER_TOKEN
+    base_tokens = length / CHARS_PER_TOKEN
 
     # Apply code multiplier if needed
     if is_code:
@@ -96,31 +130,60 @@ def estimate_tokens(text: str, is_code: bool = False) -> int:
     return int(base_tokens)
 
 
-def estimate_file_tokens(path: Path) -> int:
+def _read_text_noatime(path: Path) -> str:
+    """Same as ``path.read_text()``, without touching atime where supported."""
+    try:
+        fd = os.open(path, os.O_RDONLY | _O_NOATIME)
+    except PermissionError:
+        if not _O_NOATIME:
+            raise
+        # O_NOATIME is refused on files owned by someone else
+        fd = os.open(path, os.O_RDONLY)
+    with open(fd) as f:
+        return f.read()
+
+
+def estimate_file_tokens(path: Path, precise: bool = False) -> int:
     """Estimate tokens for a file.
     
+    By default the byte size stands in for the character count, so the
+    file is neither read nor decoded. With ``precise=True`` the file is
+    decoded and its characters counted; that estimate is cached against
+    the file's mtime and size.
+
     Args:
         path: Path to the file
+        precise: Count decoded characters instead of bytes
         
     Returns:
         Estimated token count
     """
-    if not path.exists():
+    try:
+        st = os.stat(path)
+    except OSError:
         return 0
 
+    # Detect if it's code
+    is_code = path.suffix.lower() in CODE_EXTENSIONS
+
+    if not precise:
+        return estimate_tokens("", is_code, length=st.st_size)
+
+    key = (os.fspath(path), st.st_mtime_ns, st.st_size)
+    cached = _file_token_cache.get(key)
+    if cached is not None:
+        return cached
+
     try:
-        content = path.read_text()
+        content = _read_text_noatime(path)
     except (UnicodeDecodeError, PermissionError):
         return 0
 
-    # Detect if it's code
-    code_extensions = {
-        '.py', '.js', '.ts', '.tsx', '.jsx', '.go', '.rs', '.java',
-        '.c', '.cpp', '.h', '.hpp', '.rb', '.sh', '.bash', '.zsh'
-    }
-    is_code = path.suffix.lower() in code_extensions
-
-    return estimate_tokens(content, is_code)
+    tokens = estimate_tokens(content, is_code)
+    if len(_file_token_cache) >= _FILE_TOKEN_CACHE_MAX:
+        _file_token_cache.clear()
+    _file_token_cache[key] = tokens
+    return tokens
 
 
 class ContextManager:
@@ -138,8 +201,9 @@ class ContextManager:
         self.workspace = workspace or Path.cwd()
         # Old location for migration
         self._old_state_file = self.workspace / ".claude" / "context_budget.json"
-        # New unified state
-        self._use_unified_state = True
+        # New unified state; None when falling back to the old file
+        self._sm: StateManager | None = None
+        self._legacy_dir_ready = False
         self.budget = ContextBudget(budget=budget)
         self._load_state()
 
@@ -147,26 +211,23 @@ class ContextManager:
         """Load state from unified state manager or migrate from old file."""
         try:
             from up.core.state import get_state_manager
-            manager = get_state_manager(self.workspace)
-            ctx = manager.state.context
-
-            # Sync from unified state
-            self.budget.budget = ctx.budget
-            self.budget.total_tokens = ctx.total_tokens
-            self.budget.warning_threshold = ctx.warning_threshold
-            self.budget.critical_threshold = ctx.critical_threshold
-            self.budget.session_start = ctx.session_start
-
-            # Convert entries
-            self.budget.entries = [
-                ContextEntry(**e) if isinstance(e, dict) else e
-                for e in ctx.entries
-            ]
-
         except ImportError:
             # Fallback to old file-based storage
-            self._use_unified_state = False
             self._load_state_legacy()
+            return
+
+        self._sm = get_state_manager(self.workspace)
+        ctx = self._sm.state.context
+
+        # Sync from unified state
+        self.budget.budget = ctx.budget
+        self.budget.total_tokens = ctx.total_tokens
+        self.budget.warning_threshold = ctx.warning_threshold
+        self.budget.critical_threshold = ctx.critical_threshold
+        self.budget.session_start = ctx.session_start
+
+        # Persisted entries are always plain dicts (see _save_state)
+        self.budget.entries = list(map(ContextEntry.from_dict, ctx.entries))
 
     def _load_state_legacy(self) -> None:
         """Load state from old file location (for backwards compatibility)."""
@@ -177,38 +238,49 @@ class ContextManager:
                 self.budget.total_tokens = data.get("total_tokens", 0)
                 self.budget.session_start = data.get("session_start", datetime.now().isoformat())
                 entries_data = data.get("entries", [])
-                self.budget.entries = [
-                    ContextEntry(**e) for e in entries_data
-                ]
+                self.budget.entries = list(map(ContextEntry.from_dict, entries_data))
             except (json.JSONDecodeError, KeyError, TypeError):
                 pass
 
     def _save_state(self) -> None:
         """Save state to unified state manager."""
-        if self._use_unified_state:
-            try:
-                from up.core.state import get_state_manager
-                manager = get_state_manager(self.workspace)
-
-                # Sync to unified state
-                manager.state.context.budget = self.budget.budget
-                manager.state.context.total_tokens = self.budget.total_tokens
-                manager.state.context.warning_threshold = self.budget.warning_threshold
-                manager.state.context.critical_threshold = self.budget.critical_threshold
-                manager.state.context.session_start = self.budget.session_start
-                manager.state.context.entries = [
-                    e.to_dict() if hasattr(e, 'to_dict') else e
-                    for e in self.budget.entries[-50:]  # Keep last 50
-                ]
-
-                manager.save()
-                return
-            except ImportError:
-                pass
+        if self._sm is not None:
+            # Sync to unified state
+            ctx = self._sm.state.context
+            ctx.budget = self.budget.budget
+            ctx.total_tokens = self.budget.total_tokens
+            ctx.warning_threshold = self.budget.warning_threshold
+            ctx.critical_threshold = self.budget.critical_threshold
+            ctx.session_start = self.budget.session_start
+            ctx.entries = [
+                e.to_dict() for e in self.budget.entries[-50:]  # Keep last 50
+            ]
 
-        # Fallback to old file-based storage
-        self._old_state_file.parent.mkdir(parents=True, exist_ok=True)
-        self._old_state_file.write_text(json.dumps(self.budget.to_dict(), indent=2))
+            self._sm.save()
+            return
+
+        # Fallback to old file-based storage: temp file + rename, so a crash
+        # never leaves a half-written budget file
+        if not self._legacy_dir_ready:
+            self._old_state_file.parent.mkdir(parents=True, exist_ok=True)
+            self._legacy_dir_ready = True
+        tmp_file = self._old_state_file.with_suffix(".json.tmp")
+        tmp_file.write_text(json.dumps(self.budget.to_dict(), separators=(",", ":")))
+        os.replace(tmp_file, self._old_state_file)
+
+    @contextmanager
+    def batch(self):
+        """Coalesce the state writes of several record_* calls into one.
+
+        Each record_* call saves immediately; inside this block the unified
+        state is written once, on exit. The legacy file fallback still
+        writes per call.
+        """
+        if self._sm is None:
+            yield
+            return
+        with self._sm.batch_update():
+            yield
 
     def record_file_read(self, path: Path) -> ContextEntry:
         """Record a file being read into context.
@@ -263,7 +335,7 @@ class ContextManager:
         Returns:
             The context entry created
         """
-        tokens = estimate_tokens("x" * output_size)  # Rough estimate
+        tokens = estimate_tokens("", length=output_size)  # Rough estimate
         entry = ContextEntry(
             timestamp=datetime.now().isoformat(),
             entry_type="tool_output",
@@ -346,21 +418,23 @@ class ContextManager:
         Returns:
             List of file paths to consider dropping
         """
-        # Get file entries sorted by tokens (largest first)
-        file_entries = [
-            e for e in self.budget.entries
+        # Heap of file entries, largest first; ties keep recording order.
+        # Only as many entries as the target needs are popped, so the full
+        # sort is skipped.
+        heap = [
+            (-e.estimated_tokens, i, e.source)
+            for i, e in enumerate(self.budget.entries)
             if e.entry_type == "file"
         ]
-        file_entries.sort(key=lambda e: e.estimated_tokens, reverse=True)
+        heapq.heapify(heap)
 
         suggestions = []
         reduction = 0
 
-        for entry in file_entries:
-            if reduction >= target_reduction:
-                break
-            suggestions.append(entry.source)
-            reduction += entry.estimated_tokens
+        while heap and reduction < target_reduction:
+            neg_tokens, _, source = heapq.heappop(heap)
+            suggestions.append(source)
+            reduction -= neg_tokens
 
         return suggestions
 
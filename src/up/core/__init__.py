@@ -29,10 +29,14 @@ from up.core.loop import (
 )
 from up.core.prd_schema import (
     PRD,
+    PRDSummary,
     PRDValidationError,
+    TaskSourceKind,
     UserStory,
     load_prd,
+    load_prd_summary,
     save_prd,
+    task_source_kind,
 )
 from up.core.provenance import (
     ProvenanceEntry,
@@ -90,4 +94,9 @@ __all__ = [
     "SuccessResult",
     "CircuitBreakerStatus",
     "VerificationCommands",
+    # PRD schema
+    "PRDSummary",
+    "load_prd_summary",
+    "TaskSourceKind",
+    "task_source_kind",
 ]
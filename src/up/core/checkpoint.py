@@ -16,7 +16,10 @@ from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 
-from up.core.state import get_state_manager
+from up.core.state import StateManager, get_state_manager
+
+# Porcelain paths under this prefix are up's own state, not project changes
+_STATE_PREFIX = StateManager.STATE_DIR + "/"
 
 
 @dataclass
@@ -115,22 +118,33 @@ class CheckpointManager:
         result = self._run_git("rev-parse", "HEAD")
         return result.stdout.strip()
 
+    def _get_head_info(self) -> tuple[str, str]:
+        """Get (HEAD SHA, current branch name) from a single rev-parse."""
+        result = self._run_git("rev-parse", "HEAD", "--abbrev-ref", "HEAD")
+        sha, branch = result.stdout.split()
+        return sha, branch
+
+    def _changed_files(self) -> list[str]:
+        """List uncommitted changes, one porcelain status line per file."""
+        result = self._run_git("status", "--porcelain")
+        lines: list[str] = result.stdout.splitlines()
+        return lines
+
     def _has_changes(self) -> bool:
         """Check if there are uncommitted changes."""
-        result = self._run_git("status", "--porcelain")
-        return bool(result.stdout.strip())
+        return bool(self._changed_files())
 
     def _count_changed_files(self) -> int:
         """Count number of changed files."""
-        result = self._run_git("status", "--porcelain")
-        return len(result.stdout.strip().split("\n")) if result.stdout.strip() else 0
+        return len(self._changed_files())
 
     def save(
         self,
         message: str = None,
         task_id: str = None,
         agent_id: str = None,
-        auto_commit: bool = True
+        auto_commit: bool = True,
+        reuse_clean: bool = False,
     ) -> CheckpointMetadata:
         """Create a checkpoint.
         
@@ -139,6 +153,8 @@ class CheckpointManager:
             task_id: Associated task ID
             agent_id: Associated agent ID (for worktrees)
             auto_commit: Whether to commit dirty files
+            reuse_clean: Return the last checkpoint instead of creating one
+                when the tree is clean and HEAD has not moved since it
         
         Returns:
             CheckpointMetadata for the created checkpoint
@@ -156,17 +172,27 @@ class CheckpointManager:
         if task_id:
             checkpoint_id = f"cp-{task_id}-{timestamp}"
 
+        # One status call answers both "is it dirty" and "how many files"
+        changed = self._changed_files() if (auto_commit or reuse_clean) else []
+        # up's own bookkeeping under .up/ is rewritten before every task, so
+        # it does not count against reusing a checkpoint of a clean tree
+        if reuse_clean and all(line[3:].startswith(_STATE_PREFIX) for line in changed):
+            last = self.get_last_checkpoint()
+            if last is not None and last.commit_sha == self._get_head_sha():
+                return last
+
         # Commit dirty files if requested
         files_changed = 0
-        if auto_commit and self._has_changes():
-            files_changed = self._count_changed_files()
+        if auto_commit and changed:
+            files_changed = len(changed)
             self._run_git("add", "-A")
             commit_message = message or f"checkpoint: {checkpoint_id}"
-            self._run_git("commit", "-m", commit_message)
+            # Internal snapshot commit: skip client hooks (pre-commit suites can
+            # take seconds per task and must not block the safety net)
+            self._run_git("commit", "--no-verify", "-m", commit_message)
 
         # Get commit info
-        commit_sha = self._get_head_sha()
-        branch = self._get_current_branch()
+        commit_sha, branch = self._get_head_info()
 
         # Create lightweight tag
         tag_name = f"{self.TAG_PREFIX}/{checkpoint_id}"
@@ -356,37 +382,27 @@ class CheckpointManager:
             checkpoint_id = self.state_manager.state.loop.last_checkpoint
 
         if not checkpoint_id:
-            result = self._run_git("diff", "--stat", "HEAD")
+            result = self._run_git("diff", "--numstat", "HEAD")
         else:
             tag_name = f"{self.TAG_PREFIX}/{checkpoint_id}"
-            result = self._run_git("diff", "--stat", tag_name, "HEAD", check=False)
+            result = self._run_git("diff", "--numstat", tag_name, "HEAD", check=False)
             if result.returncode != 0:
                 return {"files": 0, "insertions": 0, "deletions": 0}
 
-        # Parse stat output
-        lines = result.stdout.strip().split("\n")
-        if not lines or not lines[-1]:
-            return {"files": 0, "insertions": 0, "deletions": 0}
-
-        # Last line has summary: "X files changed, Y insertions(+), Z deletions(-)"
-        import re
-        summary = lines[-1] if lines else ""
-
+        # One "added<TAB>deleted<TAB>path" line per file; binary files
+        # report "-" for both counts
         files = 0
         insertions = 0
         deletions = 0
 
-        files_match = re.search(r"(\d+) files? changed", summary)
-        if files_match:
-            files = int(files_match.group(1))
-
-        ins_match = re.search(r"(\d+) insertions?\(\+\)", summary)
-        if ins_match:
-            insertions = int(ins_match.group(1))
-
-        del_match = re.search(r"(\d+) deletions?\(-\)", summary)
-        if del_match:
-            deletions = int(del_match.group(1))
+        for line in result.stdout.splitlines():
+            added, _, rest = line.partition("\t")
+            removed, _, _ = rest.partition("\t")
+            files += 1
+            if added.isdigit():
+                insertions += int(added)
+            if removed.isdigit():
+                deletions += int(removed)
 
         return {
             "files": files,
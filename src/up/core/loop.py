@@ -7,12 +7,12 @@ The orchestrator never prints, never prompts, never shells out to AI CLIs.
 It returns data that callers act on.
 """
 
-import json
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from up.core.checkpoint import CheckpointManager, NotAGitRepoError, get_checkpoint_manager
+from up.core.prd_schema import TaskSourceKind, task_source_kind
 from up.core.provenance import ProvenanceEntry, ProvenanceManager, get_provenance_manager
 from up.core.state import StateManager, get_state_manager
 
@@ -210,29 +210,26 @@ class LoopOrchestrator:
             return [TaskInfo(id=specific_task, title=specific_task, description=specific_task)]
 
         source = task_source or self.find_task_source()
-        if not source or not source.endswith(".json"):
+        if not source or task_source_kind(source) is not TaskSourceKind.PRD:
             task = self.get_next_task(task_source=source)
             return [task] if task else []
 
         from dataclasses import asdict
 
-        from up.core.prd_schema import PRDValidationError, load_prd
+        from up.core.prd_schema import PRDValidationError, load_prd_summary
 
         prd_path = self.workspace / source
         try:
-            prd = load_prd(prd_path)
+            summary = load_prd_summary(prd_path)
         except PRDValidationError:
             return []
 
         completed = set(self.state_manager.state.loop.tasks_completed)
-        tasks: list[TaskInfo] = []
-        for story in prd.userStories:
-            if story.passes or story.id in completed:
-                continue
-            tasks.append(TaskInfo.from_dict(asdict(story)))
-            if not run_all:
-                break
-        return tasks
+        remaining = (s for s in summary.pending if s.id not in completed)
+        if run_all:
+            return [TaskInfo.from_dict(asdict(s)) for s in remaining]
+        story = next(remaining, None)
+        return [TaskInfo.from_dict(asdict(story))] if story else []
 
     def _next_from_prd(self, task_source: str) -> dict | None:
         """Get next incomplete task dict from PRD file.
@@ -242,20 +239,17 @@ class LoopOrchestrator:
         """
         from dataclasses import asdict
 
-        from up.core.prd_schema import PRDValidationError, load_prd
+        from up.core.prd_schema import PRDValidationError, load_prd_summary
 
         prd_path = self.workspace / task_source
-        if not prd_path.exists():
-            return None
-
         try:
-            prd = load_prd(prd_path)
+            summary = load_prd_summary(prd_path)
         except PRDValidationError:
             return None
 
         completed = set(self.state_manager.state.loop.tasks_completed)
-        for story in prd.userStories:
-            if story.passes or story.id in completed:
+        for story in summary.pending:
+            if story.id in completed:
                 continue
             return asdict(story)
         return None
@@ -301,22 +295,26 @@ class LoopOrchestrator:
 
         # Update loop state
         new_iter = sm.state.loop.iteration + 1
+        # Intermediate phase saves skip fsync; the checkpoint commit is the durable anchor
         sm.update_loop(
+            durable=False,
             iteration=new_iter,
             phase="EXECUTE",
             current_task=task.id,
         )
 
-        # Create checkpoint
-        checkpoint_id = f"cp-{task.id}-{new_iter}"
+        # Create checkpoint. A clean tree still at the previous checkpoint's
+        # commit (e.g. after a failed task was rolled back) reuses it. The manager
+        # records the checkpoint's real id as last_checkpoint for rollback.
         try:
-            self.checkpoint_manager.save(message=checkpoint_id, task_id=task.id)
+            checkpoint = self.checkpoint_manager.save(
+                message=f"cp-{task.id}-{new_iter}", task_id=task.id, reuse_clean=True,
+            )
         except NotAGitRepoError:
             return BeginTaskResult(success=False, error="Not a git repo — no checkpoint safety net")
         except Exception as exc:
             return BeginTaskResult(success=False, error=f"Checkpoint failed: {exc}")
-
-        sm.update_loop(last_checkpoint=checkpoint_id)
+        checkpoint_id = checkpoint.id
 
         # Start provenance tracking
         provenance_id = None
@@ -382,12 +380,9 @@ class LoopOrchestrator:
             from up.memory import MemoryManager
             from up.memory.patterns import ErrorPatternExtractor
 
-            state_file = self.workspace / ".up" / "state.json"
-            if not state_file.exists():
-                return None
-
-            data = json.loads(state_file.read_text())
-            last_error = data.get("loop", {}).get("last_error", "")
+            # record_failure() keeps the error on the live state only, so
+            # there is nothing to re-read from state.json
+            last_error = getattr(self.state_manager.state.loop, "last_error", "")
             if not last_error:
                 return None
 
@@ -434,18 +429,17 @@ class LoopOrchestrator:
 
         # Mark task complete in PRD
         source = task_source or self.find_task_source()
-        if source and source.endswith(".json"):
+        if source and task_source_kind(source) is TaskSourceKind.PRD:
             from up.commands.start.helpers import mark_task_complete
             mark_task_complete(self.workspace, source, task.id)
 
-        # Update state
-        sm.record_task_complete(task.id)
-        sm.update_loop(phase="COMMIT", current_task=task.id)
-
-        # Reset circuit breaker on success
-        cb = sm.get_circuit_breaker("task")
-        cb.record_success()
-        sm.save()
+        # Update state and reset the circuit breaker in one write. Success
+        # bookkeeping skips fsync; callers make it durable periodically via
+        # sync_state(). Failures are always fsync'ed.
+        sm.record_task_complete(
+            task.id, durable=False, circuit_breaker="task",
+            phase="COMMIT", current_task=task.id,
+        )
 
         # Complete provenance
         if self._current_provenance:
@@ -498,18 +492,19 @@ class LoopOrchestrator:
         # Record failure in state
         sm.record_task_failed(task.id)
 
-        # Store last error for memory hint on retry
-        if error:
-            try:
-                sm.state.loop.__dict__["last_error"] = error[:1000]
-                sm.save()
-            except Exception:
-                pass
-
-        # Circuit breaker
-        cb = sm.get_circuit_breaker("task")
-        cb.record_failure()
-        sm.save()
+        with sm.batch_update():
+            # Store last error for memory hint on retry
+            if error:
+                try:
+                    sm.state.loop.__dict__["last_error"] = error[:1000]
+                    sm.save()
+                except Exception:
+                    pass
+
+            # Circuit breaker
+            cb = sm.get_circuit_breaker("task")
+            cb.record_failure()
+            sm.save()
         circuit_open = not cb.can_execute()
 
         # Doom loop check
@@ -557,13 +552,15 @@ class LoopOrchestrator:
             type_check_cmd="python3 -m mypy src/ --ignore-missing-imports --no-error-summary 2>&1 | tail -10",
         )
 
-    def run_verification(self):
+    def run_verification(self, changed_files: list[str] | None = None):
         """Run verification using subprocess (works in both CLI and skill).
 
+        ``changed_files`` lets docs-only changes skip the checks and limits
+        linting to the changed Python files.
         Returns a VerificationResult from the verification module.
         """
         from up.commands.start.verification import run_full_verification
-        return run_full_verification(self.workspace)
+        return run_full_verification(self.workspace, changed_files=changed_files)
 
     def check_verification(self, result) -> bool:
         """Check if verification result passes required checks."""
@@ -590,6 +587,10 @@ class LoopOrchestrator:
             "success_rate": sm.state.metrics.success_rate,
         }
 
+    def sync_state(self) -> None:
+        """Make state written by non-durable saves durable."""
+        self.state_manager.sync()
+
     def mark_interrupted(self) -> None:
         """Mark the current task as interrupted (for signal handlers)."""
         import time
@@ -1,12 +1,24 @@
 """Shared PRD schema for learn (writer) and start (reader)."""
 
+import functools
 import json
 import logging
+import os
 from dataclasses import asdict, dataclass, field
+from enum import Enum
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional: pip install up-cli[fast]
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# PRDs with more stories than this are written compactly (roughly 50 KB
+# of JSON); smaller ones stay pretty-printed for hand editing
+PRD_COMPACT_STORIES = 200
+
 
 @dataclass
 class UserStory:
@@ -30,6 +42,28 @@ class PRD:
     generated: str = ""
     source: str = ""
     metadata: dict = field(default_factory=dict)
+    # Story id -> position of its first occurrence in userStories
+    _by_id: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+
+    def get_story(self, task_id: str) -> UserStory | None:
+        """Look up a story by id.
+
+        Every index hit is checked against the list, so stories added,
+        removed or replaced in place trigger a rebuild instead of a stale
+        answer.
+        """
+        stories = self.userStories
+        pos = self._by_id.get(task_id)
+        if pos is None or pos >= len(stories) or stories[pos].id != task_id:
+            self._by_id = {}
+            for i, story in enumerate(stories):
+                self._by_id.setdefault(story.id, i)
+            pos = self._by_id.get(task_id)
+            if pos is None:
+                return None
+        return stories[pos]
 
     def pending_tasks(self) -> list[UserStory]:
         return [s for s in self.userStories if not s.passes]
@@ -43,29 +77,70 @@ class PRD:
         return None
 
     def mark_complete(self, task_id: str, date: str = "") -> bool:
-        for story in self.userStories:
-            if story.id == task_id:
-                story.passes = True
-                if date:
-                    story.completedAt = date
-                return True
-        return False
+        """Mark a story as passing. Returns True only if the story changed.
+
+        A story that already passes keeps its original completion date.
+        """
+        story = self.get_story(task_id)
+        if story is None:
+            return False
+        if story.passes and (story.completedAt or not date):
+            return False
+        story.passes = True
+        if date:
+            story.completedAt = date
+        return True
 
 
 class PRDValidationError(Exception):
     pass
 
 
-def load_prd(path: Path) -> PRD:
-    """Load and validate a PRD from JSON file."""
-    if not path.exists():
+class TaskSourceKind(Enum):
+    """Format of a task source file, as implied by its extension."""
+
+    NONE = "none"
+    PRD = "prd"    # prd.json user stories
+    TODO = "todo"  # markdown checklist
+
+
+def task_source_kind(task_source: str | None) -> TaskSourceKind:
+    """Classify a task source path by its extension."""
+    if not task_source:
+        return TaskSourceKind.NONE
+    if task_source.endswith(".json"):
+        return TaskSourceKind.PRD
+    if task_source.endswith(".md"):
+        return TaskSourceKind.TODO
+    return TaskSourceKind.NONE
+
+
+@functools.lru_cache(maxsize=8)
+def _read_prd_json(path: str, mtime_ns: int, size: int, ino: int) -> dict:
+    if orjson is not None:
+        # Parses the raw bytes directly; orjson.JSONDecodeError subclasses json's
+        data: dict = orjson.loads(Path(path).read_bytes())
+        return data
+    return json.loads(Path(path).read_text())
+
+
+def load_prd_data(path: Path) -> dict:
+    """Load the raw PRD JSON, reusing the last parse while the file is unchanged.
+
+    The result is shared between callers and must not be mutated.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         raise PRDValidationError(f"PRD not found: {path}")
 
     try:
-        data = json.loads(path.read_text())
+        return _read_prd_json(str(path), st.st_mtime_ns, st.st_size, st.st_ino)
     except json.JSONDecodeError as e:
         raise PRDValidationError(f"Invalid JSON in {path}: {e}")
 
+
+def _parse_stories(data: dict) -> list[UserStory]:
     stories = []
     for raw in data.get("userStories", []):
         if not isinstance(raw, dict) or "id" not in raw or "title" not in raw:
@@ -80,22 +155,62 @@ def load_prd(path: Path) -> PRD:
             phase=raw.get("phase", ""),
             passes=raw.get("passes", False),
             completedAt=raw.get("completedAt"),
-            acceptanceCriteria=raw.get("acceptanceCriteria", []),
-            depends_on=raw.get("depends_on", []),
+            acceptanceCriteria=list(raw.get("acceptanceCriteria", [])),
+            depends_on=list(raw.get("depends_on", [])),
         ))
+    return stories
+
+
+def load_prd(path: Path) -> PRD:
+    """Load and validate a PRD from JSON file."""
+    data = load_prd_data(path)
 
     return PRD(
-        userStories=stories,
+        userStories=_parse_stories(data),
         name=data.get("name", ""),
         version=data.get("version", "1.0.0"),
         generated=data.get("generated", ""),
         source=data.get("source", ""),
-        metadata=data.get("metadata", {}),
+        metadata=dict(data.get("metadata", {})),
     )
 
 
+@dataclass(frozen=True)
+class PRDSummary:
+    """Read-only view of a PRD's pending stories, in file order."""
+
+    pending: tuple[UserStory, ...]
+
+    @property
+    def remaining(self) -> int:
+        return len(self.pending)
+
+
+@functools.lru_cache(maxsize=8)
+def _summarize_prd(path: str, mtime_ns: int, size: int, ino: int) -> PRDSummary:
+    data = _read_prd_json(path, mtime_ns, size, ino)
+    return PRDSummary(pending=tuple(s for s in _parse_stories(data) if not s.passes))
+
+
+def load_prd_summary(path: Path) -> PRDSummary:
+    """Load the pending stories of a PRD, parsed once per file version.
+
+    The summary and its stories are shared between callers; use
+    ``asdict`` or ``load_prd`` when a mutable copy is needed.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise PRDValidationError(f"PRD not found: {path}")
+
+    try:
+        return _summarize_prd(str(path), st.st_mtime_ns, st.st_size, st.st_ino)
+    except json.JSONDecodeError as e:
+        raise PRDValidationError(f"Invalid JSON in {path}: {e}")
+
+
 def save_prd(prd: PRD, path: Path) -> None:
-    """Save PRD to JSON file."""
+    """Save PRD to JSON file (atomically, via a sibling temp file)."""
     data = {
         "name": prd.name,
         "version": prd.version,
@@ -104,4 +219,11 @@ def save_prd(prd: PRD, path: Path) -> None:
         "userStories": [asdict(s) for s in prd.userStories],
         "metadata": prd.metadata,
     }
-    path.write_text(json.dumps(data, indent=2))
+    # Decided from the story count so the PRD is only encoded once
+    if len(prd.userStories) > PRD_COMPACT_STORIES:
+        text = json.dumps(data, separators=(",", ":"))
+    else:
+        text = json.dumps(data, indent=2)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(text)
+    os.replace(tmp_path, path)
@@ -11,6 +11,7 @@ All state is now stored in .up/state.json
 Configuration is stored in .up/config.json
 """
 
+import hashlib
 import json
 import logging
 import os
@@ -26,6 +27,11 @@ from typing import Any, Optional
 
 from filelock import FileLock
 
+try:
+    import orjson
+except ImportError:  # optional: pip install up-cli[fast]
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -358,8 +364,9 @@ class UnifiedState:
                 })
 
         state.checkpoints = data.get("checkpoints", [])
-        state.created_at = data.get("created_at", datetime.now().isoformat())
-        state.updated_at = data.get("updated_at", datetime.now().isoformat())
+        # Defaults were stamped when ``state`` was constructed above
+        state.created_at = data.get("created_at", state.created_at)
+        state.updated_at = data.get("updated_at", state.updated_at)
 
         return state
 
@@ -368,6 +375,50 @@ class UnifiedState:
 # State Manager
 # =============================================================================
 
+def _state_json_indent() -> int | None:
+    """Indentation for state.json: compact unless ``UP_PRETTY_STATE=1``."""
+    return 2 if os.environ.get("UP_PRETTY_STATE") == "1" else None
+
+
+def _encode_state(data: dict) -> bytes:
+    """Serialize state for state.json, using orjson when it is installed."""
+    indent = _state_json_indent()
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=indent, separators=None if indent else (",", ":")).encode()
+
+
+def _read_state_json(path: Path) -> dict:
+    """Parse a state file; orjson.JSONDecodeError subclasses json's."""
+    if orjson is not None:
+        data: dict = orjson.loads(path.read_bytes())
+        return data
+    return json.loads(path.read_text())
+
+
+def _stat_key(path: Path) -> tuple[int, int, int] | None:
+    """Identity of a file's current contents: (mtime_ns, size, inode).
+
+    Writes go through os.replace() of a fresh temp file, so every save
+    yields a new inode even when mtime granularity is coarse.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _state_digest(data: dict) -> bytes:
+    """Digest a serialized state, ignoring the ``updated_at`` timestamp."""
+    payload = {k: v for k, v in data.items() if k != "updated_at"}
+    if orjson is not None:
+        encoded = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    else:
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
 class StateManager:
     """Manages unified state for up-cli.
     
@@ -406,6 +457,13 @@ class StateManager:
         # Batch updates: when > 0, save() defers writes until batch_update() exits
         self._batch_depth = 0
         self._batch_dirty = False
+        self._batch_durable = False
+        # Digest of the last state written (minus updated_at), to skip no-op saves
+        self._saved_digest: bytes | None = None
+        # Whether that last write was fsynced (see save(durable=...))
+        self._saved_durable = False
+        # Stat key of state.json as last read or written by this manager
+        self._disk_key: tuple[int, int, int] | None = None
 
     @property
     def config(self) -> UpConfig:
@@ -483,16 +541,18 @@ class StateManager:
             # Try loading new unified state
             if self.state_file.exists():
                 try:
-                    data = json.loads(self.state_file.read_text())
+                    disk_key = _stat_key(self.state_file)
+                    data = _read_state_json(self.state_file)
                     self._state = UnifiedState.from_dict(data)
                     self._apply_config_to_state()
+                    self._disk_key = disk_key
                     return self._state
                 except (json.JSONDecodeError, TypeError, KeyError) as e:
                     logger.warning("State file corrupted: %s. Trying backup.", e)
                     backup_file = self.state_file.with_suffix(".json.bak")
                     if backup_file.exists():
                         try:
-                            data = json.loads(backup_file.read_text())
+                            data = _read_state_json(backup_file)
                             self._state = UnifiedState.from_dict(data)
                             self._apply_config_to_state()
                             logger.info("Recovered state from backup file")
@@ -506,15 +566,18 @@ class StateManager:
             self._apply_config_to_state()
             return self._state
 
-    def _write_state_to_disk(self) -> None:
+    def _write_state_to_disk(self, durable: bool = True) -> None:
         """Atomic write of in-memory state to disk.
 
         Creates a rolling backup, then writes via temp file + fsync +
         os.replace() so the state file is never partially written.
+        With ``durable=False`` the fsync is skipped: the rename is still
+        atomic, but the write may be lost on power failure.
 
         Caller MUST hold ``self._lock`` before invoking this method.
         """
         self.state_dir.mkdir(parents=True, exist_ok=True)
+        data = self._state.to_dict()
 
         # Rolling backup
         if self.state_file.exists():
@@ -532,13 +595,17 @@ class StateManager:
                 suffix=".tmp",
                 prefix="state_",
             )
-            with os.fdopen(fd, "w") as f:
+            with os.fdopen(fd, "wb") as f:
                 fd = None  # os.fdopen takes ownership
-                json.dump(self._state.to_dict(), f, indent=2)
-                f.flush()
-                os.fsync(f.fileno())
+                f.write(_encode_state(data))
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
             os.replace(tmp_path, str(self.state_file))
             tmp_path = None
+            self._saved_digest = _state_digest(data)
+            self._saved_durable = durable
+            self._disk_key = _stat_key(self.state_file)
         except Exception:
             if fd is not None:
                 os.close(fd)
@@ -551,7 +618,8 @@ class StateManager:
         """Context manager to batch multiple state updates into a single disk write.
 
         Use when making several mutations (e.g. in a loop) to avoid redundant I/O.
-        On exit, writes state to disk at most once.
+        On exit, writes state to disk at most once. An atomic_update() inside
+        the batch flushes pending mutations before it re-reads the file.
         """
         self._batch_depth += 1
         try:
@@ -559,30 +627,55 @@ class StateManager:
         finally:
             self._batch_depth -= 1
             if self._batch_depth == 0 and self._batch_dirty and self._state is not None:
+                durable = self._batch_durable
                 self._batch_dirty = False
-                self._state.updated_at = datetime.now().isoformat()
-                with self._lock:
-                    self._write_state_to_disk()
+                self._batch_durable = False
+                self._save_if_changed(durable)
+
+    def save(self, durable: bool = True) -> None:
+        """Save current state to file (thread-safe, atomic). Defers when inside batch_update().
 
-    def save(self) -> None:
-        """Save current state to file (thread-safe, atomic). Defers when inside batch_update()."""
+        Skips the write when nothing but ``updated_at`` would change since
+        the last save. Pass ``durable=False`` for intermediate saves that
+        do not need an fsync.
+        """
         if self._state is None:
             return
 
-        self._state.updated_at = datetime.now().isoformat()
-
         if self._batch_depth > 0:
             self._batch_dirty = True
+            self._batch_durable = self._batch_durable or durable
+            return
+
+        self._save_if_changed(durable)
+
+    def _save_if_changed(self, durable: bool = True) -> None:
+        if self._state is None:
+            return
+        data = self._state.to_dict()
+        if (
+            self._saved_digest is not None
+            and _state_digest(data) == self._saved_digest
+            and self.state_file.exists()
+        ):
+            # Same content, but an earlier non-durable write may still be
+            # sitting in the page cache
+            if durable and not self._saved_durable:
+                self.sync()
             return
 
+        self._state.updated_at = datetime.now().isoformat()
         with self._lock:
-            self._write_state_to_disk()
+            self._write_state_to_disk(durable)
 
-    def atomic_update(self, updater: Callable[[UnifiedState], None]) -> None:
+    def atomic_update(
+        self, updater: Callable[[UnifiedState], None], durable: bool = True,
+    ) -> None:
         """Thread-safe read-modify-write on the state.
 
         Holds the file lock for the entire read-modify-write cycle
-        to prevent lost updates from concurrent access.
+        to prevent lost updates from concurrent access. ``durable=False``
+        skips the fsync, as for save().
 
         Args:
             updater: Function that mutates the state in-place.
@@ -593,12 +686,23 @@ class StateManager:
             manager.atomic_update(bump_iteration)
         """
         with self._lock:
-            # Re-read state from disk to get latest
-            if self.state_file.exists():
+            # Flush mutations deferred by an enclosing batch_update() so the
+            # re-read below does not discard them
+            if self._batch_dirty and self._state is not None:
+                batch_durable = self._batch_durable
+                self._batch_dirty = False
+                self._batch_durable = False
+                self._save_if_changed(batch_durable)
+
+            # Re-read state from disk to get latest, unless the file is
+            # still the one this manager last read or wrote
+            disk_key = _stat_key(self.state_file)
+            if disk_key is not None and (self._state is None or disk_key != self._disk_key):
                 try:
-                    data = json.loads(self.state_file.read_text())
+                    data = _read_state_json(self.state_file)
                     self._state = UnifiedState.from_dict(data)
                     self._apply_config_to_state()
+                    self._disk_key = disk_key
                 except (json.JSONDecodeError, TypeError, KeyError):
                     if self._state is None:
                         self._state = UnifiedState()
@@ -608,7 +712,24 @@ class StateManager:
             updater(self._state)
 
             self._state.updated_at = datetime.now().isoformat()
-            self._write_state_to_disk()
+            self._write_state_to_disk(durable)
+
+    def sync(self) -> None:
+        """Flush the state file to stable storage.
+
+        Pairs with non-durable saves: callers that write several times
+        without fsync call this at a safe point to make them durable.
+        """
+        with self._lock:
+            try:
+                fd = os.open(self.state_file, os.O_RDONLY)
+            except FileNotFoundError:
+                return
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self._saved_durable = True
 
     def reset(self) -> UnifiedState:
         """Reset to fresh state."""
@@ -703,12 +824,12 @@ class StateManager:
     # Convenience Methods
     # =========================================================================
 
-    def update_loop(self, **kwargs) -> None:
+    def update_loop(self, durable: bool = True, **kwargs) -> None:
         """Update loop state fields."""
         for key, value in kwargs.items():
             if hasattr(self.state.loop, key):
                 setattr(self.state.loop, key, value)
-        self.save()
+        self.save(durable)
 
     def update_context(self, **kwargs) -> None:
         """Update context state fields."""
@@ -717,14 +838,29 @@ class StateManager:
                 setattr(self.state.context, key, value)
         self.save()
 
-    def record_task_complete(self, task_id: str) -> None:
-        """Record a task completion (atomic)."""
+    def record_task_complete(
+        self,
+        task_id: str,
+        durable: bool = True,
+        circuit_breaker: str | None = None,
+        **loop_fields: Any,
+    ) -> None:
+        """Record a task completion (atomic).
+
+        ``loop_fields`` are set on the loop state and ``circuit_breaker``,
+        if given, records a success, all in the same single write.
+        """
         def _update(s: UnifiedState) -> None:
             if task_id not in s.loop.tasks_completed:
                 s.loop.tasks_completed.append(task_id)
             s.metrics.completed_tasks += 1
             s.loop.consecutive_failures = 0
-        self.atomic_update(_update)
+            for key, value in loop_fields.items():
+                if hasattr(s.loop, key):
+                    setattr(s.loop, key, value)
+            if circuit_breaker:
+                s.get_circuit_breaker(circuit_breaker, self.config).record_success()
+        self.atomic_update(_update, durable=durable)
 
     def record_task_failed(self, task_id: str) -> None:
         """Record a task failure (atomic)."""
@@ -11,6 +11,7 @@ Events flow through a central bridge that dispatches to handlers.
 
 import json
 import logging
+import re
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -20,6 +21,8 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+_UPDATED_RE = re.compile(r"\*\*Updated\*\*:\s*[\d-]+")
+
 
 class EventType(Enum):
     """Core event types in the lifecycle."""
@@ -339,18 +342,13 @@ def _update_context_md(workspace: Path, recent_change: str = None, files: list[s
         return
 
     try:
-        content = context_file.read_text()
+        original = context_file.read_text()
 
         # Update the "Updated" date
         from datetime import date
         today = date.today().isoformat()
 
-        import re
-        content = re.sub(
-            r'\*\*Updated\*\*:\s*[\d-]+',
-            f'**Updated**: {today}',
-            content
-        )
+        content = _UPDATED_RE.sub(f"**Updated**: {today}", original)
 
         # Update recent changes section if present
         if recent_change and "## Recent Changes" in content:
@@ -372,7 +370,8 @@ def _update_context_md(workspace: Path, recent_change: str = None, files: list[s
 
             content = "\n".join(new_lines)
 
-        context_file.write_text(content)
+        if content != original:
+            context_file.write_text(content)
 
     except Exception as e:
         logger.debug("Docs update failed: %s", e)
@@ -1,13 +1,13 @@
 """PRD generation for the learning system."""
 
 import json
+import sys
 from datetime import date
 from pathlib import Path
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from tqdm import tqdm
 
 from up.ai_cli import check_ai_cli, run_ai_prompt
 from up.core.state import get_state_manager
@@ -153,9 +153,18 @@ def learn_analyze(workspace: Path, use_ai: bool = True) -> None:
     all_patterns = []
     insights_dir.mkdir(parents=True, exist_ok=True)
 
-    with tqdm(files_to_analyze, desc="Analyzing", unit="file") as pbar:
+    from tqdm import tqdm
+
+    # No bar when stderr is not a terminal; otherwise redraw at most twice a second
+    with tqdm(
+        files_to_analyze,
+        desc="Analyzing",
+        unit="file",
+        disable=not sys.stderr.isatty(),
+        mininterval=0.5,
+    ) as pbar:
         for file_path in pbar:
-            pbar.set_postfix_str(file_path.name[:30])
+            pbar.set_postfix_str(file_path.name[:30], refresh=False)
 
             result = analyze_research_file(file_path, workspace)
 
@@ -243,8 +252,9 @@ def learn_plan(workspace: Path, output: str | None = None, use_ai: bool = True)
 
     # Read individual insight files
     for f in insights_dir.glob("*_insights.md"):
-        content = f.read_text()
-        insights_content.append(f"## {f.stem}\n{content[:2000]}")
+        with f.open(encoding="utf-8", errors="replace") as fh:
+            content = fh.read(2000)
+        insights_content.append(f"## {f.stem}\n{content}")
 
     # Read research files
     research_dir = skill_dir / "research"
@@ -450,7 +450,9 @@ class MemoryManager:
                     continue
 
                 try:
-                    content = full_path.read_text()[:2000]  # First 2000 chars
+                    # Only the first 2000 chars are indexed; don't read the rest
+                    with full_path.open(encoding="utf-8", errors="replace") as f:
+                        content = f.read(2000)
                 except Exception:
                     continue
 
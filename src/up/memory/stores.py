@@ -4,6 +4,9 @@ ChromaDB is the default for semantic search.
 JSON is the fallback for fast operations or when ChromaDB is unavailable.
 """
 
+import functools
+import heapq
+import importlib.util
 import json
 import os
 import tempfile
@@ -12,13 +15,10 @@ from pathlib import Path
 from up.memory.entry import MemoryEntry
 
 
+@functools.lru_cache(maxsize=1)
 def _check_chromadb() -> bool:
-    """Check if chromadb is available."""
-    try:
-        import chromadb
-        return True
-    except ImportError:
-        return False
+    """Check if chromadb is installed, without importing it."""
+    return importlib.util.find_spec("chromadb") is not None
 
 
 def _ensure_chromadb():
@@ -289,8 +289,8 @@ class JSONMemoryStore(MemoryStore):
             if score > 0:
                 scored.append((score, entry))
 
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [entry for _, entry in scored[:limit]]
+        top = heapq.nlargest(limit, scored, key=lambda x: x[0])
+        return [entry for _, entry in top]
 
     def get_by_type(
         self,
@@ -299,13 +299,12 @@ class JSONMemoryStore(MemoryStore):
         branch: str | None = None,
     ) -> list[MemoryEntry]:
         """Get entries by type, optionally filtered by branch."""
-        entries = [
+        entries = (
             e
             for e in self.entries.values()
             if e.type == entry_type and (branch is None or e.branch == branch)
-        ]
-        entries.sort(key=lambda e: e.timestamp, reverse=True)
-        return entries[:limit]
+        )
+        return heapq.nlargest(limit, entries, key=lambda e: e.timestamp)
 
     def delete(self, entry_id: str) -> bool:
         """Delete an entry."""
@@ -746,25 +746,39 @@ def _execute_wave(
     if not worktrees:
         return
 
+    def _run_agent(wt: dict) -> TaskResult:
+        """Execute then verify one task inside its own worktree.
+
+        Worktrees are independent checkouts, so verification runs in the
+        worker alongside the other agents instead of serially afterwards.
+        """
+        tid = wt["task"].get("id")
+        result = execute_task_in_worktree(wt["path"], wt["task"], cli_name, timeout)
+        if not result.success:
+            return result
+        dashboard.update_agent(tid, "verifying")
+        dashboard.log(f"Verifying {tid}...")
+        return verify_worktree(wt["path"])
+
     results: dict[str, TaskResult] = {}
     with ThreadPoolExecutor(max_workers=min(max_workers, len(worktrees))) as executor:
         futures: dict[Future, str] = {}
         for wt in worktrees:
-            tid = wt["task"].get("id")
-            future = executor.submit(
-                execute_task_in_worktree, wt["path"], wt["task"], cli_name, timeout
-            )
-            futures[future] = tid
+            future = executor.submit(_run_agent, wt)
+            futures[future] = wt["task"].get("id")
 
         for future in as_completed(futures):
             tid = futures[future]
             try:
                 result = future.result()
                 results[tid] = result
-                if result.success:
-                    dashboard.update_agent(tid, "verifying")
-                    dashboard.log(f"{tid}: AI execution complete")
+                if result.phase == "verified":
                     knowledge.add_entry(tid, "completion", f"Task {tid} implemented successfully")
+                if result.success:
+                    dashboard.update_agent(tid, "merging")
+                elif result.phase == "verified":
+                    dashboard.update_agent(tid, "failed")
+                    dashboard.log(f"[yellow]{tid}: verification failed[/]")
                 else:
                     dashboard.update_agent(tid, "failed", error=result.error)
                     dashboard.log(f"[red]{tid}: execution failed[/]")
@@ -773,18 +787,6 @@ def _execute_wave(
                 results[tid] = TaskResult(tid, False, "failed", 0, error=str(e))
                 dashboard.update_agent(tid, "failed", error=str(e))
 
-    for wt in worktrees:
-        tid = wt["task"].get("id")
-        if results.get(tid, TaskResult("", False, "failed", 0)).success:
-            dashboard.log(f"Verifying {tid}...")
-            verify_result = verify_worktree(wt["path"])
-            results[tid] = verify_result
-            if verify_result.success:
-                dashboard.update_agent(tid, "merging")
-            else:
-                dashboard.update_agent(tid, "failed")
-                dashboard.log(f"[yellow]{tid}: verification failed[/]")
-
     for wt in worktrees:
         tid = wt["task"].get("id")
         result = results.get(tid)
@@ -3,7 +3,6 @@
 Cybersecurity/AI themed terminal UI for the product loop.
 """
 
-from up.ui.loop_display import ProductLoopDisplay, TaskStatus
 from up.ui.theme import THEME, CyberTheme
 
 __all__ = [
@@ -12,3 +11,13 @@ __all__ = [
     "ProductLoopDisplay",
     "TaskStatus",
 ]
+
+
+def __getattr__(name: str):
+    # The loop display pulls in rich.live/rich.layout; load it on first use
+    # so commands that only need the theme stay cheap to import.
+    if name in ("ProductLoopDisplay", "TaskStatus"):
+        from up.ui import loop_display
+
+        return getattr(loop_display, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
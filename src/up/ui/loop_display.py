@@ -7,6 +7,7 @@ Auto-detects terminal size and adapts layout accordingly.
 from __future__ import annotations
 
 import shutil
+import threading
 import time
 from collections import deque
 from dataclasses import dataclass, field
@@ -41,6 +42,7 @@ class LoopStatus(Enum):
     RUNNING = "running"
     VERIFYING = "verifying"
     PAUSED = "paused"
+    STOPPING = "stopping"
     FAILED = "failed"
     COMPLETE = "complete"
 
@@ -117,7 +119,11 @@ class ProductLoopDisplay:
         self.live: Live | None = None
         self._running = False
         self._spinner_frame = 0
+        # Task id -> position of its first occurrence in state.tasks
+        self._task_index: dict[str, int] = {}
         self._last_update = time.time()
+        # Guards state read by the Live refresh thread (notably log_entries)
+        self._render_lock = threading.Lock()
 
     def start(self) -> None:
         """Start the live display."""
@@ -128,12 +134,14 @@ class ProductLoopDisplay:
         self.state.status = LoopStatus.RUNNING
         self._running = True
 
-        # Create live display with appropriate refresh rate
+        # Frames are built on each refresh tick rather than on every state
+        # change, so bursts of log lines (e.g. streamed AI output) coalesce
+        # into at most refresh_per_second renders.
         self.live = Live(
-            self._render(),
             console=self.console,
             refresh_per_second=4,
             transient=False,
+            get_renderable=self._render_frame,
         )
         self.live.start()
 
@@ -150,9 +158,15 @@ class ProductLoopDisplay:
     def update(self) -> None:
         """Force update the display."""
         if self.live and self._running:
+            self.live.refresh()
+
+    def _render_frame(self) -> RenderableType:
+        """Build one frame for the Live refresh loop."""
+        with self._render_lock:
+            self._last_update = time.time()
             self._update_elapsed()
             self._spinner_frame = (self._spinner_frame + 1) % len(Symbols.SPINNER)
-            self.live.update(self._render())
+            return self._render()
 
     def _update_elapsed(self) -> None:
         """Update elapsed time."""
@@ -161,15 +175,17 @@ class ProductLoopDisplay:
             self.state.stats.elapsed_seconds = delta.total_seconds()
 
     # ─── State Setters ───────────────────────────────────────────────────
+    # Setters only mutate state; the Live refresh tick renders it, the
+    # same as log(). Call update() to force an immediate frame.
 
     def set_status(self, status: LoopStatus) -> None:
         """Set the overall loop status."""
         self.state.status = status
-        self.update()
 
     def set_tasks(self, tasks: list[dict]) -> None:
         """Set the task queue from PRD task dicts."""
         self.state.tasks = []
+        self._task_index = {}
         for t in tasks:
             task_info = TaskInfo(
                 id=t.get("id", ""),
@@ -180,46 +196,59 @@ class ProductLoopDisplay:
                 description=t.get("description", ""),
                 status=TaskStatus.COMPLETE if t.get("passes") else TaskStatus.PENDING,
             )
+            self._task_index.setdefault(task_info.id, len(self.state.tasks))
             self.state.tasks.append(task_info)
 
         self.state.stats.total = len(tasks)
         self.state.stats.completed = sum(1 for t in self.state.tasks if t.status == TaskStatus.COMPLETE)
         self.update()
 
+    def _find_task(self, task_id: str) -> TaskInfo | None:
+        """Look up a queued task by id.
+
+        The index stores positions and every hit is checked against the
+        list, so tasks added, removed or replaced since it was built only
+        cost a rebuild on the lookup that notices.
+        """
+        tasks = self.state.tasks
+        pos = self._task_index.get(task_id)
+        if pos is None or pos >= len(tasks) or tasks[pos].id != task_id:
+            self._task_index = {}
+            for i, task in enumerate(tasks):
+                self._task_index.setdefault(task.id, i)
+            pos = self._task_index.get(task_id)
+            if pos is None:
+                return None
+        return tasks[pos]
+
     def set_current_task(self, task_id: str, phase: str = "EXECUTE") -> None:
         """Set the current task being processed."""
         self.state.current_phase = phase
         self.state.phase_start_time = datetime.now()
 
-        for task in self.state.tasks:
-            if task.id == task_id:
-                task.status = TaskStatus.IN_PROGRESS
-                self.state.current_task = task
-                break
-
-        self.update()
+        task = self._find_task(task_id)
+        if task is not None:
+            task.status = TaskStatus.IN_PROGRESS
+            self.state.current_task = task
 
     def update_task_status(self, task_id: str, status: TaskStatus) -> None:
         """Update a task's status."""
-        for task in self.state.tasks:
-            if task.id == task_id:
-                task.status = status
-
-                if status == TaskStatus.COMPLETE:
-                    self.state.stats.completed += 1
-                elif status == TaskStatus.FAILED:
-                    self.state.stats.failures += 1
-                elif status == TaskStatus.ROLLED_BACK:
-                    self.state.stats.rollbacks += 1
-                break
+        task = self._find_task(task_id)
+        if task is not None:
+            task.status = status
+
+            if status == TaskStatus.COMPLETE:
+                self.state.stats.completed += 1
+            elif status == TaskStatus.FAILED:
+                self.state.stats.failures += 1
+            elif status == TaskStatus.ROLLED_BACK:
+                self.state.stats.rollbacks += 1
 
         # Clear current task if it's the one being updated
         if self.state.current_task and self.state.current_task.id == task_id:
             if status in (TaskStatus.COMPLETE, TaskStatus.FAILED, TaskStatus.ROLLED_BACK):
                 self.state.current_task = None
 
-        self.update()
-
     def set_phase(self, phase: str) -> None:
         """Set the current phase and reset the phase timer."""
         self.state.current_phase = phase
@@ -228,19 +257,18 @@ class ProductLoopDisplay:
             self.state.status = LoopStatus.VERIFYING
         elif phase in ("EXECUTE", "RESEARCH", "PLAN", "IMPLEMENT"):
             self.state.status = LoopStatus.RUNNING
-        self.update()
 
     def increment_iteration(self) -> None:
         """Increment the iteration counter."""
         self.state.stats.current_iteration += 1
-        self.update()
 
     def log(self, message: str, style: str = "") -> None:
         """Add a log entry."""
         timestamp = datetime.now().strftime("%H:%M:%S")
         entry = (timestamp, message, style)
-        self.state.log_entries.append(entry)
-        self.update()
+        # No forced render: the next refresh tick picks the entry up
+        with self._render_lock:
+            self.state.log_entries.append(entry)
 
     def log_success(self, message: str) -> None:
         """Add a success log entry."""
@@ -378,6 +406,7 @@ class ProductLoopDisplay:
             LoopStatus.RUNNING: ("status.running", f"{spinner} RUNNING"),
             LoopStatus.VERIFYING: ("status.verifying", "◉ VERIFYING"),
             LoopStatus.PAUSED: ("status.paused", "◉ PAUSED"),
+            LoopStatus.STOPPING: ("status.paused", "◉ STOPPING AFTER CURRENT STEP"),
             LoopStatus.FAILED: ("status.failed", "◉ FAILED"),
             LoopStatus.COMPLETE: ("status.complete", "◉ COMPLETE"),
             LoopStatus.IDLE: ("text.dim", "◉ IDLE"),
@@ -407,6 +436,7 @@ class ProductLoopDisplay:
             LoopStatus.RUNNING: CyberTheme.STATUS_RUNNING,
             LoopStatus.VERIFYING: CyberTheme.STATUS_VERIFYING,
             LoopStatus.PAUSED: CyberTheme.STATUS_PAUSED,
+            LoopStatus.STOPPING: CyberTheme.STATUS_PAUSED,
             LoopStatus.FAILED: CyberTheme.STATUS_FAILED,
             LoopStatus.COMPLETE: CyberTheme.STATUS_COMPLETE,
         }
@@ -5,6 +5,7 @@ Provides:
 - state_manager: StateManager initialized with temp workspace
 - cli_runner: Click CliRunner with isolated filesystem
 - mock_git: pytest-subprocess fixture pre-configured for git commands
+- _reset_which_cache (autouse): clears memoized AI CLI lookups between tests
 """
 
 import json
@@ -14,9 +15,18 @@ import pytest
 from click.testing import CliRunner
 from pathlib import Path
 
+from up.ai.engine import clear_which_cache
 from up.core.state import StateManager, UnifiedState
 
 
+@pytest.fixture(autouse=True)
+def _reset_which_cache():
+    """Tests patch shutil.which freely; never serve a lookup from another test."""
+    clear_which_cache()
+    yield
+    clear_which_cache()
+
+
 @pytest.fixture
 def workspace(tmp_path):
     """Create a temporary workspace with .up/ directory.
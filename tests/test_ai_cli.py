@@ -60,6 +60,38 @@ class TestCheckAiCli:
             assert name == ""
             assert available is False
 
+    def test_which_lookup_is_memoized(self):
+        with patch("shutil.which", return_value="/usr/bin/claude") as mock_which:
+            check_ai_cli()
+            check_ai_cli()
+            assert mock_which.call_count == 1
+
+    def test_which_cache_invalidated_by_path_change(self, monkeypatch):
+        with patch("shutil.which", return_value="/usr/bin/claude") as mock_which:
+            check_ai_cli()
+            monkeypatch.setenv("PATH", "/nonexistent")
+            check_ai_cli()
+            assert mock_which.call_count == 2
+
+    def test_up_ai_cli_env_pins_cli(self, monkeypatch):
+        monkeypatch.setenv("UP_AI_CLI", "agent")
+        with patch("shutil.which", return_value="/usr/bin/x") as mock_which:
+            assert check_ai_cli() == ("agent", True)
+            mock_which.assert_called_once_with("agent")
+
+    def test_up_ai_cli_env_reports_missing_cli(self, monkeypatch):
+        monkeypatch.setenv("UP_AI_CLI", "agent")
+        with patch("shutil.which", return_value=None):
+            assert check_ai_cli() == ("agent", False)
+
+
+    @pytest.mark.parametrize("value", ["/usr/bin/claude", "cluade"])
+    def test_up_ai_cli_env_rejects_unknown_cli(self, monkeypatch, caplog, value):
+        monkeypatch.setenv("UP_AI_CLI", value)
+        with patch("shutil.which", side_effect=lambda name: f"/usr/bin/{name}"):
+            assert check_ai_cli() == ("claude", True)
+        assert "Ignoring UP_AI_CLI" in caplog.text
+
 
 class TestRunAiPrompt:
     """Tests for run_ai_prompt."""
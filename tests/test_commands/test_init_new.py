@@ -1,6 +1,7 @@
 """Tests for up init and up new commands."""
 
 import json
+import stat
 from pathlib import Path
 
 import pytest
@@ -60,6 +61,69 @@ class TestInitCommand:
             assert not Path(".claude/skills/learning-system/SKILL.md").exists()
 
 
+class TestHooks:
+    """Tests for git hook detection and installation."""
+
+    def test_detects_installed_and_appended_hooks(self, tmp_path):
+        from up.commands.init import check_hooks_installed
+
+        assert check_hooks_installed(tmp_path) == {
+            "git": False, "post_commit": False, "post_checkout": False,
+        }
+
+        (tmp_path / ".git").mkdir()
+        assert check_hooks_installed(tmp_path)["git"] is True
+
+        hooks = tmp_path / ".git" / "hooks"
+        hooks.mkdir()
+        assert check_hooks_installed(tmp_path)["post_commit"] is False
+
+        # A user hook with our block appended far from the top
+        (hooks / "post-commit").write_text("#!/bin/sh\n" + "# user\n" * 2000 + "# up-cli\n")
+        (hooks / "post-checkout").write_text("#!/bin/sh\necho custom\n")
+        assert check_hooks_installed(tmp_path) == {
+            "git": True, "post_commit": True, "post_checkout": False,
+        }
+
+    def test_write_hook_appends_once_and_skips_current(self, tmp_path, monkeypatch):
+        from up.commands.init import _write_hook
+
+        hook = tmp_path / "post-commit"
+        hook.write_text("#!/bin/sh\necho custom\n")
+        _write_hook(hook, "# up-cli hook\n")
+        assert hook.read_text() == "#!/bin/sh\necho custom\n\n\n# up-cli hook\n"
+        assert hook.stat().st_mode & stat.S_IEXEC
+
+        monkeypatch.setattr(Path, "write_bytes", lambda *a: pytest.fail("rewrote hook"))
+        monkeypatch.setattr(Path, "chmod", lambda *a: pytest.fail("chmod'ed hook"))
+        _write_hook(hook, "# up-cli hook\n")
+        assert hook.read_text().count("up-cli") == 1
+
+    def test_write_hook_replaces_older_up_hook(self, tmp_path):
+        from up.commands.init import _write_hook
+
+        hook = tmp_path / "post-commit"
+        hook.write_text("# up-cli old hook\nup memory sync\n")
+        _write_hook(hook, "# up-cli hook\n")
+        assert hook.read_text() == "# up-cli hook\n"
+
+    def test_write_hook_replaces_only_our_block(self, tmp_path):
+        from up.commands.init import _write_hook
+
+        hook = tmp_path / "post-commit"
+        hook.write_text(
+            "#!/bin/sh\necho before\n"
+            "# >>> up-cli hook start\nold\n# <<< up-cli hook end\n"
+            "echo after\n"
+        )
+        _write_hook(hook, "#!/bin/bash\n# >>> up-cli hook start\nnew\n# <<< up-cli hook end\n")
+        assert hook.read_text() == (
+            "#!/bin/sh\necho before\n"
+            "# >>> up-cli hook start\nnew\n# <<< up-cli hook end\n"
+            "echo after\n"
+        )
+
+
 class TestNewCommand:
     """Tests for up new."""
 
@@ -6,6 +6,7 @@ verification, and PRD schema integration.
 
 import json
 import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -33,6 +34,75 @@ def prd_file(workspace):
     return path
 
 
+# Outcome for a fake check that never exits within its timeout
+HANG = "hang"
+
+
+class FakeChecks:
+    """Stands in for ``subprocess.Popen`` in run_full_verification.
+
+    Records every launched command and a (event, tool) log. ``outcomes``
+    maps a tool to its exit code (default 0), ``HANG``, or an exception
+    that wait() raises while the check is still running.
+    """
+
+    def __init__(self):
+        self.commands = []
+        self.events = []
+        self.outcomes = {}
+        self.procs = []
+
+    @property
+    def launched(self):
+        return [cmd[2] for cmd in self.commands]
+
+    def popen(self, cmd, **kwargs):
+        proc = _FakeProc(self, cmd)
+        self.procs.append(proc)
+        return proc
+
+
+class _FakeProc:
+    def __init__(self, checks, cmd):
+        self.checks = checks
+        self.tool = cmd[2]
+        self.returncode = None
+        self.reaped = False
+        checks.commands.append(cmd)
+        checks.events.append(("start", self.tool))
+
+    def wait(self, timeout=None):
+        self.checks.events.append(("wait", self.tool))
+        if self.returncode is not None:
+            self.reaped = True
+            return self.returncode
+        outcome = self.checks.outcomes.get(self.tool, 0)
+        if outcome == HANG:
+            raise subprocess.TimeoutExpired(self.tool, timeout)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        self.returncode = outcome
+        return outcome
+
+    def poll(self):
+        return self.returncode
+
+    def kill(self):
+        self.checks.events.append(("kill", self.tool))
+        self.returncode = -9
+
+
+@pytest.fixture
+def fake_checks(monkeypatch):
+    """Run verification against FakeChecks with every tool installed."""
+    from up.commands.start import verification
+
+    checks = FakeChecks()
+    monkeypatch.setattr(verification.subprocess, "Popen", checks.popen)
+    monkeypatch.setattr(verification, "_tool_available", lambda module: True)
+    return checks
+
+
 # ── get_next_task_from_prd ────────────────────────────────────────────
 
 
@@ -80,6 +150,41 @@ class TestGetNextTask:
         assert get_next_task_from_prd(bad, workspace) is None
 
 
+# ── build_implementation_prompt ───────────────────────────────────────
+
+
+class TestImplementationPrompt:
+    def test_truncates_long_readme(self, workspace):
+        from up.commands.start.helpers import README_EXCERPT_CHARS, build_implementation_prompt
+
+        (workspace / "README.md").write_text("x" * (README_EXCERPT_CHARS * 3))
+        prompt = build_implementation_prompt(workspace, {"id": "T-001"}, "prd.json")
+        assert "x" * README_EXCERPT_CHARS + "..." in prompt
+        assert "x" * (README_EXCERPT_CHARS + 1) not in prompt
+
+    def test_short_readme_kept_whole(self, workspace):
+        from up.commands.start.helpers import build_implementation_prompt
+
+        (workspace / "Readme.md").write_text("# Short")
+        prompt = build_implementation_prompt(workspace, {"id": "T-001"}, "prd.json")
+        assert "Project README:\n# Short\n" in prompt
+
+    def test_phase_prompts_accept_preformatted_header(self, workspace):
+        from up.commands.start.helpers import (
+            build_implement_prompt,
+            build_plan_prompt,
+            format_task_header,
+        )
+
+        task = {"id": "T-001", "title": "Add login", "files": ["src/auth.py"]}
+        header = format_task_header(task)
+        assert header.startswith("Task ID: T-001\nTitle: Add login\nDescription: Add login")
+        assert "  - src/auth.py" in header
+        assert build_plan_prompt(workspace, task, "prd.json", header) == \
+            build_plan_prompt(workspace, task, "prd.json")
+        assert header in build_implement_prompt(workspace, task, "prd.json", header)
+
+
 # ── mark_task_complete ────────────────────────────────────────────────
 
 
@@ -101,6 +206,20 @@ class TestMarkTaskComplete:
         data = json.loads(prd_file.read_text())
         assert data["userStories"][0]["passes"] is False
 
+    def test_already_complete_is_not_rewritten(self, workspace, prd_file):
+        from up.commands.start.helpers import mark_task_complete
+
+        data = json.loads(prd_file.read_text())
+        data["userStories"][0].update(passes=True, completedAt="2020-01-01")
+        prd_file.write_text(json.dumps(data))
+        before = prd_file.stat().st_mtime_ns
+
+        mark_task_complete(workspace, "prd.json", "T-001")
+
+        assert prd_file.stat().st_mtime_ns == before
+        story = json.loads(prd_file.read_text())["userStories"][0]
+        assert story["completedAt"] == "2020-01-01"
+
     def test_noop_for_non_json(self, workspace):
         from up.commands.start.helpers import mark_task_complete
 
@@ -108,6 +227,59 @@ class TestMarkTaskComplete:
         mark_task_complete(workspace, "TODO.md", "T-001")
 
 
+# ── save_loop_state ───────────────────────────────────────────────────
+
+
+class TestSaveLoopState:
+    def test_updates_circuit_breaker_in_place(self, workspace):
+        from up.commands.start.helpers import load_loop_state, save_loop_state
+        from up.core.state import get_state_manager
+
+        sm = get_state_manager(workspace)
+        cb = sm.get_circuit_breaker("task")
+        cb.record_failure()
+        opened = cb.last_failure
+
+        state = load_loop_state(workspace)
+        state["phase"] = "EXECUTE"
+        state["circuit_breaker"]["task"]["failures"] = 2
+        save_loop_state(workspace, state)
+
+        assert sm.get_circuit_breaker("task") is cb
+        assert cb.failures == 2
+        assert cb.last_failure == opened
+        assert sm.state.loop.phase == "EXECUTE"
+
+
+# ── handle_interrupt ──────────────────────────────────────────────────
+
+
+class TestHandleInterrupt:
+    def test_first_signal_only_sets_flag(self, monkeypatch):
+        from up.commands.start import loop
+
+        monkeypatch.setattr(loop, "_interrupt_requested", False)
+        loop.handle_interrupt(2, None)
+        assert loop._interrupt_requested is True
+
+    def test_first_signal_marks_display_stopping(self, monkeypatch):
+        from up.commands.start import loop
+        from up.ui.loop_display import LoopStatus
+
+        display = loop.ProductLoopDisplay(loop.console)
+        monkeypatch.setattr(loop, "_interrupt_requested", False)
+        monkeypatch.setattr(loop, "_active_display", display)
+        loop.handle_interrupt(2, None)
+        assert display.state.status is LoopStatus.STOPPING
+
+    def test_second_signal_aborts(self, monkeypatch):
+        from up.commands.start import loop
+
+        monkeypatch.setattr(loop, "_interrupt_requested", True)
+        with pytest.raises(KeyboardInterrupt):
+            loop.handle_interrupt(2, None)
+
+
 # ── check_circuit_breaker ─────────────────────────────────────────────
 
 
@@ -134,6 +306,41 @@ class TestCircuitBreaker:
         assert result["open"] is False
 
 
+# ── is_initialized ────────────────────────────────────────────────────
+
+
+class TestIsInitialized:
+    def test_detects_marker(self, tmp_path):
+        from up.commands.start.helpers import is_initialized
+
+        assert is_initialized(tmp_path) is False
+        (tmp_path / "CLAUDE.md").write_text("# hi")
+        assert is_initialized(tmp_path) is True
+
+    def test_missing_workspace(self, tmp_path):
+        from up.commands.start.helpers import is_initialized
+
+        assert is_initialized(tmp_path / "nope") is False
+
+    def test_cached_until_directory_changes(self, tmp_path, monkeypatch):
+        import os
+
+        from up.commands.start import helpers
+
+        old = 1_000_000_000_000_000_000
+        os.utime(tmp_path, ns=(old, old))
+        calls = []
+        real_scan = helpers._scan_dir
+        monkeypatch.setattr(helpers, "_scan_dir", lambda p: calls.append(p) or real_scan(p))
+
+        assert helpers.is_initialized(tmp_path) is False
+        assert helpers.is_initialized(tmp_path) is False
+        assert len(calls) == 1
+
+        (tmp_path / ".up").mkdir()
+        assert helpers.is_initialized(tmp_path) is True
+
+
 # ── find_task_source ──────────────────────────────────────────────────
 
 
@@ -154,6 +361,25 @@ class TestFindTaskSource:
 
         assert find_task_source(workspace) is None
 
+    def test_ignores_directories_named_like_sources(self, workspace):
+        from up.commands.start.helpers import find_task_source
+
+        (workspace / "prd.json").mkdir()
+        (workspace / "TODO.md").write_text("- [ ] a\n")
+        assert find_task_source(workspace) == "TODO.md"
+
+    def test_finds_nested_sources_in_priority_order(self, workspace):
+        from up.commands.start.helpers import find_task_source
+
+        (workspace / "docs" / "todo").mkdir(parents=True)
+        (workspace / "docs" / "todo" / "TODO.md").write_text("- [ ] a\n")
+        assert find_task_source(workspace) == "docs/todo/TODO.md"
+
+        skills = workspace / ".claude" / "skills" / "learning-system"
+        skills.mkdir(parents=True)
+        (skills / "prd.json").write_text("{}")
+        assert find_task_source(workspace) == ".claude/skills/learning-system/prd.json"
+
 
 # ── count_tasks ───────────────────────────────────────────────────────
 
@@ -170,11 +396,76 @@ class TestCountTasks:
         (workspace / "TODO.md").write_text("- [ ] one\n- [x] done\n- [ ] two\n")
         assert count_tasks(workspace, "TODO.md") == 2
 
+    def test_counts_md_checkboxes_across_chunks(self, workspace, monkeypatch):
+        from up.commands.start import helpers
+
+        monkeypatch.setattr(helpers, "_COUNT_CHUNK_THRESHOLD", 0)
+        monkeypatch.setattr(helpers, "_COUNT_CHUNK_SIZE", 7)
+        (workspace / "TODO.md").write_text("- [ ] one\n- [x] done\n- [ ] two\n" * 5)
+        assert helpers.count_tasks(workspace, "TODO.md") == 10
+
+    def test_skips_malformed_stories_like_get_next_task(self, workspace):
+        from up.commands.start.helpers import count_tasks, get_next_task_from_prd
+
+        path = workspace / "prd.json"
+        path.write_text(json.dumps({"userStories": [
+            {"title": "no id"},
+            "not a story",
+            {"id": "T-001", "title": "Real"},
+        ]}))
+        # Only stories the loop can actually pick up count as remaining
+        assert count_tasks(workspace, "prd.json") == 1
+        assert get_next_task_from_prd(path, workspace)["id"] == "T-001"
+
     def test_missing_file(self, workspace):
         from up.commands.start.helpers import count_tasks
 
         assert count_tasks(workspace, "nope.json") == 0
 
+    def test_reuses_parse_until_file_changes(self, workspace, prd_file):
+        from up.commands.start.helpers import count_tasks
+        from up.core.prd_schema import _read_prd_json, load_prd, save_prd
+
+        _read_prd_json.cache_clear()
+        assert count_tasks(workspace, "prd.json") == 2
+        load_prd(prd_file)
+        assert _read_prd_json.cache_info().hits == 1
+
+        prd = load_prd(prd_file)
+        prd.mark_complete("T-001", "2026-01-01")
+        save_prd(prd, prd_file)
+        assert count_tasks(workspace, "prd.json") == 1
+
+
+# ── display_status_table ──────────────────────────────────────────────
+
+
+class TestDisplayStatusTable:
+    def test_plain_output_when_not_a_terminal(self, workspace, prd_file, capsys):
+        from up.commands.start.helpers import display_status_table
+
+        state = {"iteration": 3, "phase": "VERIFY", "tasks_completed": ["T-000"]}
+        display_status_table(state, "prd.json", workspace, resume=True)
+
+        out = capsys.readouterr().out
+        assert "Iteration: 3" in out
+        assert "Tasks: 2 remaining from prd.json" in out
+        assert "Mode: Resume" in out
+        assert "[cyan]" not in out
+
+    def test_plain_output_goes_through_console(self, workspace, prd_file, monkeypatch):
+        from io import StringIO
+
+        from rich.console import Console
+
+        from up.commands.start import helpers
+
+        buf = StringIO()
+        monkeypatch.setattr(helpers, "console", Console(file=buf, force_terminal=False))
+        helpers.display_status_table({"iteration": 1}, "prd.json", workspace, resume=False)
+        assert "Iteration: 1" in buf.getvalue()
+        assert "Mode: Fresh Start" in buf.getvalue()
+
 
 # ── verification ──────────────────────────────────────────────────────
 
@@ -192,6 +483,108 @@ class TestVerification:
         files = get_modified_files(git_workspace)
         assert "new.txt" in files
 
+    def test_get_modified_files_covers_all_change_kinds(self, git_workspace):
+        from up.commands.start.verification import get_modified_files
+
+        (git_workspace / "README.md").write_text("changed\n")
+        (git_workspace / "sub dir").mkdir()
+        (git_workspace / "sub dir" / "new file.py").write_text("x = 1\n")
+        (git_workspace / "staged.txt").write_text("s\n")
+        subprocess.run(["git", "add", "staged.txt"], cwd=git_workspace, capture_output=True)
+
+        files = get_modified_files(git_workspace)
+        assert "README.md" in files
+        assert "sub dir/new file.py" in files
+        assert "staged.txt" in files
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="needs byte file names")
+    def test_get_modified_files_non_utf8_name(self, git_workspace):
+        import os
+
+        from up.commands.start.verification import get_modified_files
+
+        (git_workspace / "ok.txt").write_text("x")
+        with open(os.path.join(os.fsencode(git_workspace), b"caf\xe9.txt"), "w") as f:
+            f.write("x")
+
+        files = get_modified_files(git_workspace)
+        assert "ok.txt" in files
+        assert os.fsdecode(b"caf\xe9.txt") in files
+
+    def test_full_verification_runs_checks_concurrently(self, workspace, fake_checks):
+        from up.commands.start import verification
+
+        fake_checks.outcomes.update(pytest=5, ruff=1, mypy=HANG)
+        result = verification.run_full_verification(workspace)
+
+        assert fake_checks.events[:3] == [
+            ("start", "pytest"), ("start", "ruff"), ("start", "mypy"),
+        ]
+        assert ("kill", "mypy") in fake_checks.events
+        assert result.tests_passed is None
+        assert result.lint_passed is False
+        assert result.type_check_passed is None
+
+    def test_full_verification_reaps_checks_on_interrupt(self, workspace, fake_checks):
+        from up.commands.start import verification
+
+        for tool in ("pytest", "ruff", "mypy"):
+            fake_checks.outcomes[tool] = KeyboardInterrupt()
+        with pytest.raises(KeyboardInterrupt):
+            verification.run_full_verification(workspace)
+        assert all(proc.reaped for proc in fake_checks.procs)
+
+    def test_full_verification_skips_docs_only_changes(self, workspace, fake_checks):
+        from up.commands.start import verification
+
+        result = verification.run_full_verification(
+            workspace, changed_files=["README.md", "docs/guide.rst"],
+        )
+        assert fake_checks.commands == []
+        assert result.skipped is True
+        assert (result.tests_passed, result.lint_passed, result.type_check_passed) == (
+            None, None, None,
+        )
+        assert result.summary_parts() == ["checks skipped (docs-only change)"]
+
+    @pytest.mark.parametrize("changed", [["requirements.txt"], ["docs/conf.py", "README.md"]])
+    def test_full_verification_runs_for_non_doc_files(self, workspace, fake_checks, changed):
+        from up.commands.start import verification
+
+        result = verification.run_full_verification(workspace, changed_files=changed)
+        assert result.skipped is False
+        assert "pytest" in fake_checks.launched
+
+    def test_full_verification_runs_when_no_changes_listed(self, workspace, fake_checks):
+        from up.commands.start import verification
+
+        verification.run_full_verification(workspace, changed_files=[])
+        assert fake_checks.launched == ["pytest", "ruff", "mypy"]
+
+    def test_full_verification_lints_only_changed_python(self, workspace, fake_checks):
+        from up.commands.start import verification
+
+        (workspace / "app.py").write_text("x = 1\n")
+        verification.run_full_verification(
+            workspace, changed_files=["app.py", "gone.py", "notes.md"],
+        )
+
+        ruff = next(c for c in fake_checks.commands if c[2] == "ruff")
+        assert ruff[3:] == ["check", "app.py"]
+        pytest_cmd = next(c for c in fake_checks.commands if c[2] == "pytest")
+        assert "-x" in pytest_cmd and "--ff" in pytest_cmd
+
+    def test_full_verification_skips_missing_tools(self, workspace, fake_checks, monkeypatch):
+        from up.commands.start import verification
+
+        monkeypatch.setattr(verification, "_tool_available", lambda module: module == "pytest")
+        result = verification.run_full_verification(workspace)
+
+        assert fake_checks.launched == ["pytest"]
+        assert result.tests_passed is True
+        assert result.lint_passed is None
+        assert result.type_check_passed is None
+
     def test_commit_changes(self, git_workspace):
         from up.commands.start.verification import commit_changes
 
@@ -223,6 +616,26 @@ class TestPRDSchema:
         assert len(loaded.userStories) == 1
         assert loaded.userStories[0].id == "X-1"
 
+    def test_save_encodes_once_and_compacts_large_prds(self, workspace, monkeypatch):
+        from up.core import prd_schema
+
+        dumps = []
+        real_dumps = prd_schema.json.dumps
+        monkeypatch.setattr(
+            prd_schema.json, "dumps", lambda *a, **kw: dumps.append(kw) or real_dumps(*a, **kw),
+        )
+        monkeypatch.setattr(prd_schema, "PRD_COMPACT_STORIES", 1)
+        path = workspace / "prd.json"
+
+        prd_schema.save_prd(PRD(userStories=[UserStory(id="A", title="a")]), path)
+        assert len(dumps) == 1
+        assert "\n" in path.read_text()
+
+        stories = [UserStory(id="A", title="a"), UserStory(id="B", title="b")]
+        prd_schema.save_prd(PRD(userStories=stories), path)
+        assert len(dumps) == 2
+        assert "\n" not in path.read_text()
+
     def test_next_task_skips_completed_ids(self, workspace):
         prd = PRD(userStories=[
             UserStory(id="A", title="a"),
@@ -231,6 +644,17 @@ class TestPRDSchema:
         task = prd.next_task(completed_ids={"A"})
         assert task.id == "B"
 
+    def test_get_story_tracks_appended_stories(self):
+        prd = PRD(userStories=[UserStory(id="A", title="a")])
+        assert prd.get_story("A").title == "a"
+        assert prd.get_story("B") is None
+
+        prd.userStories.append(UserStory(id="B", title="b"))
+        assert prd.get_story("B").title == "b"
+
+        prd.userStories[0] = UserStory(id="A", title="a, reloaded")
+        assert prd.get_story("A").title == "a, reloaded"
+
     def test_validation_error_on_bad_json(self, workspace):
         from up.core.prd_schema import load_prd, PRDValidationError
 
@@ -244,3 +668,39 @@ class TestPRDSchema:
 
         with pytest.raises(PRDValidationError):
             load_prd(workspace / "nope.json")
+
+    def test_summary_lists_pending_stories_in_order(self, workspace):
+        from up.core.prd_schema import load_prd_summary, save_prd
+
+        path = workspace / "prd.json"
+        save_prd(PRD(userStories=[
+            UserStory(id="A", title="a", passes=True),
+            UserStory(id="B", title="b"),
+            UserStory(id="C", title="c"),
+        ]), path)
+
+        summary = load_prd_summary(path)
+        assert summary.remaining == 2
+        assert [s.id for s in summary.pending] == ["B", "C"]
+        assert load_prd_summary(path) is summary
+
+    def test_loads_without_orjson(self, workspace, monkeypatch):
+        from up.core import prd_schema
+
+        monkeypatch.setattr(prd_schema, "orjson", None)
+        prd_schema._read_prd_json.cache_clear()
+        path = workspace / "prd.json"
+        prd_schema.save_prd(PRD(userStories=[UserStory(id="A", title="a")]), path)
+        assert prd_schema.load_prd(path).userStories[0].id == "A"
+
+        path.write_text("not json")
+        with pytest.raises(prd_schema.PRDValidationError):
+            prd_schema.load_prd(path)
+
+    def test_task_source_kind(self):
+        from up.core.prd_schema import TaskSourceKind, task_source_kind
+
+        assert task_source_kind("prd.json") is TaskSourceKind.PRD
+        assert task_source_kind("docs/todo/TODO.md") is TaskSourceKind.TODO
+        assert task_source_kind("tasks.txt") is TaskSourceKind.NONE
+        assert task_source_kind(None) is TaskSourceKind.NONE
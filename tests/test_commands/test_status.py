@@ -0,0 +1,55 @@
+"""Tests for the up status command."""
+
+import io
+import json
+
+from click.testing import CliRunner
+from rich.console import Console
+
+from up.commands import status as status_mod
+
+
+class TestStatusJson:
+    def test_json_output_is_parseable(self, workspace, monkeypatch):
+        monkeypatch.chdir(workspace)
+        result = CliRunner().invoke(status_mod.status_cmd, ["--json"])
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["workspace"] == str(workspace)
+
+    def test_dumps_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(status_mod, "orjson", None)
+        status = {"skills": ["[bold]not markup[/]"], "hooks": None}
+        assert json.loads(status_mod._dumps_status(status)) == status
+
+
+class TestStatusDisplay:
+    def test_report_is_written_once(self, workspace, monkeypatch):
+        class CountingIO(io.StringIO):
+            writes = 0
+
+            def write(self, text):
+                CountingIO.writes += 1
+                return super().write(text)
+
+        out = CountingIO()
+        monkeypatch.setattr(status_mod, "console", Console(file=out, width=100))
+        monkeypatch.chdir(workspace)
+        result = CliRunner().invoke(status_mod.status_cmd, [])
+
+        assert result.exit_code == 0
+        assert "Circuit Breaker" in out.getvalue()
+        assert CountingIO.writes == 1
+
+
+class TestCollectSkills:
+    def test_lists_skill_dirs_with_skill_md(self, tmp_path):
+        skills = tmp_path / ".claude" / "skills"
+        (skills / "product-loop").mkdir(parents=True)
+        (skills / "product-loop" / "SKILL.md").write_text("# skill")
+        (skills / "draft").mkdir()
+        (skills / "notes.md").write_text("not a skill")
+
+        assert status_mod._list_skills(skills) == ["product-loop"]
+        assert status_mod._list_skills(tmp_path / ".cursor" / "skills") == []
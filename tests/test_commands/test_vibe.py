@@ -18,21 +18,14 @@ def vibe_workspace(git_workspace):
 class TestSaveCommand:
     """Tests for `up save` command."""
 
-    def test_save_clean_workdir(self, vibe_workspace):
+    def test_save_clean_workdir(self, vibe_workspace, monkeypatch):
+        # Click commands use cwd; chdir first so the real repo is never touched
+        monkeypatch.chdir(vibe_workspace)
         runner = CliRunner()
-        result = runner.invoke(save_cmd, [], catch_exceptions=False, obj={
-        })
         # Should succeed (checkpoints even clean states)
-        # Note: Click commands use cwd, so we need to chdir
-        import os
-        old_cwd = os.getcwd()
-        try:
-            os.chdir(vibe_workspace)
-            result = runner.invoke(save_cmd, [])
-            assert result.exit_code == 0
-            assert "Checkpoint created" in result.output or "No changes" in result.output
-        finally:
-            os.chdir(old_cwd)
+        result = runner.invoke(save_cmd, [])
+        assert result.exit_code == 0
+        assert "Checkpoint created" in result.output or "No changes" in result.output
 
     def test_save_with_dirty_files(self, vibe_workspace):
         # Create dirty file
@@ -160,3 +153,26 @@ class TestDiffCommand:
             assert result.exit_code == 0
         finally:
             os.chdir(old_cwd)
+
+    def test_per_file_rendering_matches_whole_diff(self, monkeypatch):
+        import io
+
+        from rich.console import Console
+        from rich.syntax import Syntax
+
+        import up.commands.vibe as vibe_mod
+
+        diff = (
+            "diff --git a/x b/x\n--- a/x\n+++ b/x\n@@ -1 +1 @@\n-a\n+b\n"
+            "diff --git a/y b/y\n--- a/y\n+++ b/y\n@@ -1 +1 @@\n-c\n+d\n"
+        )
+
+        def render(print_fn):
+            out = io.StringIO()
+            monkeypatch.setattr(vibe_mod, "console", Console(file=out, width=60))
+            print_fn()
+            return out.getvalue()
+
+        whole = render(lambda: vibe_mod.console.print(
+            Syntax(diff, "diff", theme="monokai", line_numbers=False)))
+        assert render(lambda: vibe_mod._print_diff(diff)) == whole
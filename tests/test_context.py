@@ -0,0 +1,100 @@
+"""Tests for up.context token estimation and budget tracking."""
+
+import json
+
+import pytest
+
+import up.context as context_mod
+from up.context import ContextEntry, ContextManager, estimate_file_tokens, estimate_tokens
+
+
+class TestEstimateTokens:
+    def test_known_length_matches_text(self):
+        assert estimate_tokens("", length=1000) == estimate_tokens("x" * 1000) == 250
+        assert estimate_tokens("", is_code=True, length=1000) == 325
+        assert estimate_tokens("", length=0) == 0
+
+
+class TestEstimateFileTokens:
+    def test_estimates_from_size_without_reading(self, tmp_path, monkeypatch):
+        src = tmp_path / "mod.py"
+        src.write_bytes(b"x" * 400)
+        monkeypatch.setattr(
+            context_mod, "_read_text_noatime", lambda path: pytest.fail("read file"),
+        )
+
+        assert estimate_file_tokens(src) == 130
+        assert estimate_file_tokens(tmp_path / "missing.py") == 0
+
+    def test_precise_count_is_cached_until_file_changes(self, tmp_path, monkeypatch):
+        notes = tmp_path / "notes.md"
+        notes.write_text("é" * 400, encoding="utf-8")
+        assert estimate_file_tokens(notes, precise=True) == 100
+        assert estimate_file_tokens(notes) == 200
+
+        monkeypatch.setattr(context_mod, "_read_text_noatime", lambda path: pytest.fail("re-read"))
+        assert estimate_file_tokens(notes, precise=True) == 100
+        monkeypatch.undo()
+
+        notes.write_text("x" * 800)
+        assert estimate_file_tokens(notes, precise=True) == 200
+
+    def test_precise_read_falls_back_when_noatime_refused(self, tmp_path, monkeypatch):
+        real_open = context_mod.os.open
+
+        def refuse_noatime(path, flags, *args):
+            if context_mod._O_NOATIME and flags & context_mod._O_NOATIME:
+                raise PermissionError("not owner")
+            return real_open(path, flags, *args)
+
+        monkeypatch.setattr(context_mod.os, "open", refuse_noatime)
+        src = tmp_path / "mod.py"
+        src.write_text("line\r\n" * 10)
+        assert context_mod._read_text_noatime(src) == src.read_text()
+
+
+class TestContextManagerBatch:
+    def test_batch_writes_state_once(self, workspace, monkeypatch):
+        import up.core.state as state_mod
+
+        ctx = ContextManager(workspace)
+        writes = []
+        real_write = state_mod.StateManager._write_state_to_disk
+        monkeypatch.setattr(
+            state_mod.StateManager, "_write_state_to_disk",
+            lambda self, *a, **kw: writes.append(1) or real_write(self, *a, **kw),
+        )
+
+        with ctx.batch():
+            ctx.record_message("hello")
+            ctx.record_tool_output("pytest", 4000)
+            ctx.record_message("world")
+        assert len(writes) == 1
+
+        reloaded = ContextManager(workspace)
+        assert reloaded.budget.total_tokens == ctx.budget.total_tokens
+        assert len(reloaded.budget.entries) == 3
+
+
+class TestSuggestFilesToDrop:
+    def test_largest_files_first_until_target(self, workspace):
+        ctx = ContextManager(workspace)
+        for source, tokens in [("a.py", 100), ("b.py", 500), ("c.py", 300), ("d.py", 500)]:
+            ctx.budget.entries.append(ContextEntry("t", "file", source, tokens))
+        ctx.budget.entries.append(ContextEntry("t", "message", "user message", 9000))
+
+        assert ctx.suggest_files_to_drop(900) == ["b.py", "d.py"]
+        assert ctx.suggest_files_to_drop(1001) == ["b.py", "d.py", "c.py"]
+        assert ctx.suggest_files_to_drop(0) == []
+
+
+class TestLegacyStorage:
+    def test_fallback_writes_budget_file(self, workspace):
+        ctx = ContextManager(workspace)
+        ctx._sm = None
+        ctx.record_message("hello")
+        ctx.record_message("again")
+
+        budget_file = workspace / ".claude" / "context_budget.json"
+        assert json.loads(budget_file.read_text())["entry_count"] == 2
+        assert not budget_file.with_suffix(".json.tmp").exists()
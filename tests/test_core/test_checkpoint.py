@@ -59,6 +59,80 @@ class TestCheckpointManager:
         meta = mgr.save(message="Before AI work")
         assert meta.files_changed > 0
 
+    def test_save_runs_status_and_rev_parse_once(self, git_workspace, monkeypatch):
+        (git_workspace / "a.txt").write_text("a")
+        (git_workspace / "b.txt").write_text("b")
+        mgr = CheckpointManager(git_workspace)
+        calls = []
+        real_run_git = CheckpointManager._run_git
+        monkeypatch.setattr(
+            CheckpointManager, "_run_git",
+            lambda self, *args, **kw: calls.append(args[0]) or real_run_git(self, *args, **kw),
+        )
+
+        meta = mgr.save(message="Before AI work")
+        assert meta.files_changed >= 2
+        assert calls.count("status") == 1
+        assert calls.count("rev-parse") == 2  # --git-dir probe + HEAD/branch
+        branch = subprocess.run(
+            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+            cwd=git_workspace, capture_output=True, text=True,
+        )
+        assert meta.branch == branch.stdout.strip()
+
+    def test_save_skips_commit_hooks(self, git_workspace):
+        """A failing pre-commit hook must not block checkpoint commits."""
+        hook = git_workspace / ".git" / "hooks" / "pre-commit"
+        hook.write_text("#!/bin/sh\nexit 1\n")
+        hook.chmod(0o755)
+        (git_workspace / "new_file.txt").write_text("hello world")
+
+        mgr = CheckpointManager(git_workspace)
+        meta = mgr.save(message="Before AI work")
+        assert meta.files_changed > 0
+        tracked = subprocess.run(
+            ["git", "ls-files", "new_file.txt"],
+            cwd=git_workspace, capture_output=True, text=True,
+        )
+        assert tracked.stdout.strip() == "new_file.txt"
+
+    def test_save_reuses_clean_checkpoint(self, git_workspace, monkeypatch):
+        from click.testing import CliRunner
+
+        from up.cli import main
+
+        # The layout `up init` produces, committed: .up/ is not ignored
+        monkeypatch.chdir(git_workspace)
+        result = CliRunner().invoke(main, ["init", "--no-hooks", "--no-memory"])
+        assert result.exit_code == 0
+        subprocess.run(["git", "add", "-A"], cwd=git_workspace, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "up init"], cwd=git_workspace, capture_output=True)
+
+        mgr = CheckpointManager(git_workspace)
+        first = mgr.save(task_id="US-001")
+
+        # begin_task rewrites .up/state.json right before it saves
+        mgr.state_manager.update_loop(phase="EXECUTE", current_task="US-002")
+        assert mgr.save(task_id="US-002", reuse_clean=True).id == first.id
+
+        (git_workspace / "new_file.txt").write_text("hello world")
+        second = mgr.save(task_id="US-002", reuse_clean=True)
+        assert second.commit_sha != first.commit_sha
+        assert mgr.state_manager.state.loop.last_checkpoint == second.id
+
+    def test_diff_stats_counts_numstat_lines(self, git_workspace):
+        mgr = CheckpointManager(git_workspace)
+        meta = mgr.save(message="Before AI work")
+
+        (git_workspace / "README.md").write_text("# Changed\nline two\n")
+        (git_workspace / "logo.bin").write_bytes(b"\x00\x01\x02")
+        subprocess.run(
+            ["git", "add", "README.md", "logo.bin"], cwd=git_workspace, capture_output=True,
+        )
+        subprocess.run(["git", "commit", "-m", "AI work"], cwd=git_workspace, capture_output=True)
+
+        assert mgr.diff_stats(meta.id) == {"files": 2, "insertions": 2, "deletions": 1}
+
     def test_save_records_in_state(self, git_workspace):
         mgr = CheckpointManager(git_workspace)
         meta = mgr.save()
@@ -134,6 +134,37 @@ class TestTaskLifecycle:
         status = orch.get_status()
         assert "US-001" in status["tasks_failed"]
 
+    def test_record_failure_rolls_back_to_task_checkpoint(self, orch, workspace):
+        task = TaskInfo(id="US-001", title="Add feature")
+        begin = orch.begin_task(task)
+        assert orch.state_manager.state.loop.last_checkpoint == begin.checkpoint_id
+
+        (workspace / "dummy.txt").write_text("broken by AI")
+        result = orch.record_failure(task, error="tests failed")
+        assert result.rolled_back is True
+        assert (workspace / "dummy.txt").read_text() == "init"
+
+    def test_begin_task_reuses_checkpoint_after_rollback(self, orch):
+        first = orch.begin_task(TaskInfo(id="US-001", title="Add feature"))
+        orch.record_failure(TaskInfo(id="US-001", title="Add feature"), error="tests failed")
+
+        second = orch.begin_task(TaskInfo(id="US-002", title="Next feature"))
+        assert second.checkpoint_id == first.checkpoint_id
+
+    def test_memory_hint_sees_last_failure(self, orch, monkeypatch):
+        from up.memory.patterns import ErrorPatternExtractor
+
+        seen = []
+        monkeypatch.setattr(
+            ErrorPatternExtractor, "extract", lambda self, text: seen.append(text) or [],
+        )
+        task = TaskInfo(id="US-001", title="Add feature")
+        orch.begin_task(task)
+        orch.record_failure(task, error="ImportError: no module foo", rollback=False)
+
+        assert orch.get_memory_hint(task) is None
+        assert seen == ["ImportError: no module foo"]
+
 
 class TestTaskSource:
     """Tests for task source discovery."""
@@ -155,6 +186,18 @@ class TestTaskSource:
     def test_explicit_path_takes_priority(self, orch):
         assert orch.find_task_source("custom.json") == "custom.json"
 
+    def test_get_tasks_skips_completed(self, orch, workspace):
+        (workspace / "prd.json").write_text(json.dumps({"userStories": [
+            {"id": "US-001", "title": "Done", "passes": True},
+            {"id": "US-002", "title": "Recorded in state"},
+            {"id": "US-003", "title": "Next"},
+            {"id": "US-004", "title": "Later"},
+        ]}))
+        orch.state_manager.record_task_complete("US-002")
+
+        assert [t.id for t in orch.get_tasks("prd.json")] == ["US-003"]
+        assert [t.id for t in orch.get_tasks("prd.json", run_all=True)] == ["US-003", "US-004"]
+
 
 class TestVerificationCommands:
     """Tests for verification command generation."""
@@ -239,3 +239,48 @@ class TestSharedKnowledge:
 
         assert not errors
         assert len(sk._data["entries"]) == 50
+
+
+class TestExecuteWave:
+    """Tests for _execute_wave worker fan-out."""
+
+    def test_verification_runs_in_workers(self, workspace):
+        from unittest.mock import MagicMock, patch
+
+        from up.parallel import TaskResult, scheduler
+
+        verify_threads = []
+
+        def fake_verify(path):
+            verify_threads.append(threading.current_thread().name)
+            return TaskResult(path.name, True, "verified", 0)
+
+        tasks = [{"id": "T1", "title": "one"}, {"id": "T2", "title": "two"}]
+        summary = {"completed": [], "failed": [], "partial_merged": []}
+
+        with patch.object(scheduler, "create_worktree",
+                          side_effect=lambda tid, title: (workspace / tid, None)), \
+             patch.object(
+                 scheduler, "execute_task_in_worktree",
+                 side_effect=lambda p, t, c, to: TaskResult(t["id"], True, "executed", 0),
+             ), \
+             patch.object(scheduler, "verify_worktree", side_effect=fake_verify), \
+             patch.object(scheduler, "merge_worktree", return_value=True), \
+             patch.object(scheduler, "mark_task_complete_in_prd"):
+            scheduler._execute_wave(
+                workspace=workspace,
+                tasks=tasks,
+                cli_name="claude",
+                timeout=10,
+                max_workers=2,
+                state_mgr=MagicMock(),
+                knowledge=SharedKnowledge(workspace),
+                dashboard=MagicMock(),
+                prd_path=workspace / "prd.json",
+                summary=summary,
+                enable_partial_merge=False,
+            )
+
+        assert sorted(summary["completed"]) == ["T1", "T2"]
+        assert len(verify_threads) == 2
+        assert threading.main_thread().name not in verify_threads
@@ -133,13 +133,131 @@ class TestStateManager:
 
     def test_save_creates_backup(self, workspace):
         sm = StateManager(workspace)
-        sm.load()
+        state = sm.load()
         sm.save()  # First save, no backup source
+        state.loop.iteration = 1
         sm.save()  # Second save creates backup
 
         bak = workspace / ".up" / "state.json.bak"
         assert bak.exists()
 
+    def test_state_written_compact_unless_pretty_requested(self, workspace, monkeypatch):
+        state_file = workspace / ".up" / "state.json"
+        sm = StateManager(workspace)
+        sm.load().loop.iteration = 1
+        sm.save()
+        assert "\n" not in state_file.read_text()
+
+        monkeypatch.setenv("UP_PRETTY_STATE", "1")
+        sm.state.loop.iteration = 2
+        sm.save()
+        assert '\n  "loop": {' in state_file.read_text()
+        assert json.loads(state_file.read_text())["loop"]["iteration"] == 2
+
+    def test_state_roundtrip_without_orjson(self, workspace, monkeypatch):
+        import up.core.state as state_mod
+
+        monkeypatch.setattr(state_mod, "orjson", None)
+        sm = StateManager(workspace)
+        sm.load().loop.tasks_completed.append("US-001")
+        sm.save()
+
+        assert "\n" not in (workspace / ".up" / "state.json").read_text()
+        assert StateManager(workspace).load().loop.tasks_completed == ["US-001"]
+
+    def test_non_durable_save_skips_fsync(self, workspace, monkeypatch):
+        import up.core.state as state_mod
+
+        synced = []
+        monkeypatch.setattr(state_mod.os, "fsync", lambda fd: synced.append(fd))
+        sm = StateManager(workspace)
+        sm.load()
+
+        sm.update_loop(durable=False, phase="EXECUTE")
+        assert synced == []
+        assert StateManager(workspace).load().loop.phase == "EXECUTE"
+
+        with sm.batch_update():
+            sm.update_loop(durable=False, phase="VERIFY")
+            sm.update_loop(phase="COMMIT")
+        assert len(synced) == 1
+
+    def test_durable_save_syncs_unchanged_non_durable_write(self, workspace, monkeypatch):
+        import up.core.state as state_mod
+
+        synced = []
+        monkeypatch.setattr(state_mod.os, "fsync", lambda fd: synced.append(fd))
+        sm = StateManager(workspace)
+        sm.load()
+
+        sm.update_loop(durable=False, phase="COMMIT")
+        sm.save(durable=True)
+        assert len(synced) == 1
+        sm.save(durable=True)  # already durable: nothing to do
+        assert len(synced) == 1
+
+    def test_atomic_update_inside_batch_keeps_pending_changes(self, workspace):
+        sm = StateManager(workspace)
+        sm.load()
+
+        with sm.batch_update():
+            sm.update_loop(phase="VERIFY")
+            sm.record_task_complete("T-1")
+            sm.update_loop(current_task="T-2")
+
+        loaded = StateManager(workspace).load()
+        assert loaded.loop.phase == "VERIFY"
+        assert loaded.loop.current_task == "T-2"
+        assert "T-1" in loaded.loop.tasks_completed
+
+    def test_atomic_update_flushes_batch_with_fresh_timestamp(self, workspace, monkeypatch):
+        sm = StateManager(workspace)
+        sm.load()
+        sm.state.updated_at = "stale"
+
+        written = []
+        write = sm._write_state_to_disk
+
+        def record(durable=True):
+            written.append(sm.state.updated_at)
+            write(durable)
+
+        monkeypatch.setattr(sm, "_write_state_to_disk", record)
+        with sm.batch_update():
+            sm.update_loop(phase="VERIFY")
+            sm.atomic_update(lambda state: state.loop.tasks_completed.append("T-1"))
+
+        assert len(written) == 2
+        assert "stale" not in written
+
+    def test_sync_flushes_state_file(self, workspace, monkeypatch):
+        import up.core.state as state_mod
+
+        sm = StateManager(workspace)
+        sm.load()
+        sm.sync()  # no file yet: nothing to flush
+
+        sm.record_task_complete("T-1", durable=False)
+        synced = []
+        monkeypatch.setattr(state_mod.os, "fsync", lambda fd: synced.append(fd))
+        sm.sync()
+        assert len(synced) == 1
+        assert "T-1" in StateManager(workspace).load().loop.tasks_completed
+
+    def test_save_skips_unchanged_state(self, workspace):
+        sm = StateManager(workspace)
+        state = sm.load()
+        state.loop.iteration = 3
+        sm.save()
+        written = (workspace / ".up" / "state.json").stat().st_mtime_ns
+
+        sm.save()  # Nothing changed, no rewrite
+        assert (workspace / ".up" / "state.json").stat().st_mtime_ns == written
+
+        state.loop.phase = "EXECUTE"
+        sm.save()
+        assert StateManager(workspace).load().loop.phase == "EXECUTE"
+
     def test_load_recovers_from_corrupt_state(self, workspace):
         sm = StateManager(workspace)
         state = sm.load()
@@ -184,6 +302,27 @@ class TestStateManager:
         assert sm.state.metrics.completed_tasks == 1
         assert sm.state.loop.consecutive_failures == 0
 
+    def test_record_task_complete_single_write(self, state_manager, monkeypatch):
+        sm = state_manager
+        sm.load()
+        cb = sm.get_circuit_breaker("task")
+        cb.failures = 2
+        sm.save()
+
+        writes = []
+        original = sm._write_state_to_disk
+        monkeypatch.setattr(
+            sm, "_write_state_to_disk", lambda *a, **kw: writes.append(1) or original(*a, **kw),
+        )
+        sm.record_task_complete(
+            "US-001", circuit_breaker="task", phase="COMMIT", current_task="US-001",
+        )
+
+        assert len(writes) == 1
+        assert sm.state.loop.phase == "COMMIT"
+        assert sm.state.loop.current_task == "US-001"
+        assert sm.get_circuit_breaker("task").failures == 1
+
     def test_record_task_failed(self, state_manager):
         sm = state_manager
         sm.load()
@@ -249,6 +388,30 @@ class TestStateManager:
         sm2 = StateManager(workspace)
         assert sm2.load().loop.iteration == 99
 
+    def test_atomic_update_rereads_only_external_changes(self, workspace, monkeypatch):
+        import up.core.state as state_mod
+
+        reads = []
+        real_read = state_mod._read_state_json
+        monkeypatch.setattr(
+            state_mod, "_read_state_json", lambda path: reads.append(path) or real_read(path),
+        )
+        sm = StateManager(workspace)
+        sm.load()
+        sm.save()
+        sm.atomic_update(lambda s: setattr(s.loop, "iteration", 1))
+        sm.atomic_update(lambda s: setattr(s.loop, "iteration", 2))
+        assert reads == []
+
+        other = StateManager(workspace)
+        other.atomic_update(lambda s: setattr(s.loop, "phase", "VERIFY"))
+        reads.clear()
+
+        sm.atomic_update(lambda s: setattr(s.loop, "iteration", 3))
+        assert len(reads) == 1
+        loaded = StateManager(workspace).load()
+        assert (loaded.loop.phase, loaded.loop.iteration) == ("VERIFY", 3)
+
     def test_update_config(self, workspace):
         sm = StateManager(workspace)
         sm.load()
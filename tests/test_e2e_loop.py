@@ -188,3 +188,32 @@ def test_doom_loop_circuit_breaker(git_workspace, test_prd, mock_ai_engine):
     cb_status = check_circuit_breaker(load_loop_state(git_workspace), workspace=git_workspace)
     assert cb_status.get("open") is True
     assert "circuit opened after" in cb_status.get("reason")
+
+
+def test_interrupt_during_research_skips_remaining_phases(git_workspace, test_prd, monkeypatch):
+    """A first Ctrl+C during research stops before the plan phase starts."""
+    from up.commands.start import loop
+
+    monkeypatch.setattr(loop, "_interrupt_requested", False)  # restored afterwards
+    calls = []
+
+    def fake_run_task(ws, prompt, cli, **kwargs):
+        calls.append(prompt)
+        loop._interrupt_requested = True  # as handle_interrupt would
+        return True, "research done"
+
+    with patch("up.commands.start.loop.run_ai_task", side_effect=fake_run_task):
+        with pytest.raises(SystemExit) as exc_info:
+            run_ai_product_loop(
+                workspace=git_workspace,
+                state={"iteration": 0},
+                task_source="prd.json",
+                specific_task="US-E2E-01",
+                cli_name="claude",
+                verify=False,
+                interactive=False,
+            )
+
+    assert exc_info.value.code == 130
+    assert len(calls) == 1
+    assert loop._active_display is None
@@ -1,5 +1,6 @@
 """Tests for internal hook runtime and hook script correctness."""
 
+import os
 import stat
 import textwrap
 from pathlib import Path
@@ -30,6 +31,14 @@ class TestSyncMemory:
             result = sync_memory(tmp_path)
         assert "error" in result
 
+    def test_silences_native_stderr_writes(self, capfd):
+        from up._hook_runtime import _silenced_stderr
+
+        with _silenced_stderr():
+            os.write(2, b"chromadb noise\n")
+        os.write(2, b"visible\n")
+        assert capfd.readouterr().err == "visible\n"
+
 
 class TestSyncContext:
     """Tests for the context refresh invoked by post-checkout hook."""
@@ -44,6 +53,19 @@ class TestSyncContext:
         assert result["updated"] == 1
         assert "2025-01-01" not in ctx.read_text()
 
+    def test_skips_write_when_already_current(self, tmp_path):
+        from datetime import date
+
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        ctx = docs / "CONTEXT.md"
+        ctx.write_text(f"**Updated**: {date.today().isoformat()}\n")
+        mtime = ctx.stat().st_mtime_ns
+
+        result = sync_context(tmp_path)
+        assert result["updated"] == 0
+        assert ctx.stat().st_mtime_ns == mtime
+
     def test_noop_when_no_context_file(self, tmp_path):
         result = sync_context(tmp_path)
         assert result["updated"] == 0
@@ -0,0 +1,58 @@
+"""Tests for the product loop display state updates."""
+
+from rich.console import Console
+
+from up.ui.loop_display import ProductLoopDisplay, TaskInfo, TaskStatus
+
+
+def _display(tasks):
+    display = ProductLoopDisplay(Console(file=None, force_terminal=False))
+    display.set_tasks(tasks)
+    return display
+
+
+class TestTaskLookup:
+    def test_status_updates_by_id(self):
+        display = _display([
+            {"id": "T-001", "title": "One"},
+            {"id": "T-002", "title": "Two", "passes": True},
+        ])
+
+        display.set_current_task("T-001")
+        assert display.state.current_task.id == "T-001"
+        assert display.state.tasks[0].status == TaskStatus.IN_PROGRESS
+
+        display.update_task_status("T-001", TaskStatus.COMPLETE)
+        assert display.state.tasks[0].status == TaskStatus.COMPLETE
+        assert display.state.stats.completed == 2
+        assert display.state.current_task is None
+
+    def test_unknown_id_is_ignored(self):
+        display = _display([{"id": "T-001", "title": "One"}])
+        display.update_task_status("NOPE", TaskStatus.FAILED)
+        assert display.state.stats.failures == 0
+
+    def test_tasks_appended_after_set_tasks_are_found(self):
+        display = _display([{"id": "T-001", "title": "One"}])
+        display.state.tasks.append(TaskInfo(id="T-002", title="Two"))
+
+        display.update_task_status("T-002", TaskStatus.FAILED)
+        assert display.state.tasks[1].status == TaskStatus.FAILED
+
+    def test_duplicate_ids_do_not_force_rebuilds(self):
+        display = _display([
+            {"id": "T-001", "title": "One"},
+            {"id": "T-001", "title": "One again"},
+            {"id": "T-002", "title": "Two"},
+        ])
+        index = display._task_index
+        assert display._find_task("T-002").title == "Two"
+        assert display._find_task("T-001").title == "One"
+        assert display._task_index is index
+
+    def test_task_replaced_in_place_is_found(self):
+        display = _display([{"id": "T-001", "title": "One"}, {"id": "T-002", "title": "Two"}])
+        display.state.tasks[1] = TaskInfo(id="T-002", title="Two, reloaded")
+
+        display.update_task_status("T-002", TaskStatus.FAILED)
+        assert display.state.tasks[1].status == TaskStatus.FAILED